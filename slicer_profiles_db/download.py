@@ -9,6 +9,7 @@ import logging
 import re
 import shutil
 import tempfile
+from collections.abc import Iterator
 from pathlib import Path
 from zipfile import ZipFile
 
@@ -136,9 +137,13 @@ def get_source_config(slicer: SlicerType) -> SourceConfig:
     return DEFAULT_CONFIGS[slicer]
 
 
+# Version strings that name a branch rather than a release tag.
+BRANCH_NAMES = frozenset({"main", "master", "develop", "dev"})
+
+
 def _looks_like_branch(version: str) -> bool:
     """Return True if the version string looks like a branch name, not a tag."""
-    return version in ("main", "master", "develop", "dev")
+    return version in BRANCH_NAMES
 
 
 def _build_zip_url(repo: str, version: str | None, branch: str | None) -> str:
@@ -413,6 +418,23 @@ def apply_overlays(extracted_dir: Path, overlay_dir: Path, slicer: SlicerType) -
     Copies all files (not just *.json) — overlays may include .stl, .png, .svg
     assets alongside profile JSONs.
     """
+    for overlay_file, rel in iter_overlay_files(overlay_dir, slicer):
+        dest = extracted_dir / rel
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        # Replace rather than write through: extracted resources may already
+        # be hardlinked into the resource store.
+        dest.unlink(missing_ok=True)
+        shutil.copy2(overlay_file, dest)
+
+
+def iter_overlay_files(
+    overlay_dir: Path, slicer: SlicerType
+) -> Iterator[tuple[Path, Path]]:
+    """Yield each overlay file with its destination relative to the extracted dir.
+
+    These are the files apply_overlays copies; callers that keep profiles in
+    memory can read them in place instead.
+    """
     slicer_overlay = overlay_dir / slicer.value
     if not slicer_overlay.exists():
         return
@@ -420,12 +442,8 @@ def apply_overlays(extracted_dir: Path, overlay_dir: Path, slicer: SlicerType) -
     for vendor_dir in slicer_overlay.iterdir():
         if not vendor_dir.is_dir():
             continue
-        dest_vendor = extracted_dir / vendor_dir.name
-        dest_vendor.mkdir(parents=True, exist_ok=True)
         for overlay_file in vendor_dir.rglob("*"):
             if overlay_file.is_dir():
                 continue
             rel = overlay_file.relative_to(vendor_dir)
-            dest = dest_vendor / rel
-            dest.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(overlay_file, dest)
+            yield overlay_file, Path(vendor_dir.name) / rel
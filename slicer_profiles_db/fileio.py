@@ -0,0 +1,107 @@
+"""Filesystem helpers shared across the package: tree walks, reads and writes."""
+
+import logging
+import os
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Files read ahead of the consumer in read_files_batched
+_READ_BATCH_SIZE = 256
+
+
+def iter_files(
+    directory: str | Path,
+    suffix: str | None = None,
+    *,
+    skip_private: bool = False,
+    follow_symlinks: bool = False,
+) -> Iterator[os.DirEntry[str]]:
+    """Yield the file entries below ``directory`` in depth-first listing order.
+
+    Walks with a stack of ``os.scandir`` iterators, entering each subdirectory
+    where it is listed.  Missing or unreadable directories are skipped.
+
+    Args:
+        directory: Root of the walk.
+        suffix: Only yield files whose name ends with this suffix.
+        skip_private: Prune files and directories whose name starts with ``_``.
+        follow_symlinks: Descend into symlinked directories.  Off by default,
+            like ``Path.rglob``.
+    """
+    root = _scandir_or_none(directory)
+    if root is None:
+        return
+    stack = [root]
+    try:
+        while stack:
+            for entry in stack[-1]:
+                if skip_private and entry.name.startswith("_"):
+                    continue
+                if entry.is_dir(follow_symlinks=follow_symlinks):
+                    subdir = _scandir_or_none(entry.path)
+                    if subdir is not None:
+                        stack.append(subdir)
+                        break
+                    continue
+                if suffix is not None and not entry.name.endswith(suffix):
+                    continue
+                if entry.is_file():
+                    yield entry
+            else:
+                stack.pop().close()
+    finally:
+        for entries in stack:
+            entries.close()
+
+
+def _scandir_or_none(directory: str | Path) -> Iterator[os.DirEntry[str]] | None:
+    """Open ``directory`` with ``os.scandir``, or return None if it cannot be."""
+    try:
+        return os.scandir(directory)
+    except (FileNotFoundError, NotADirectoryError, PermissionError):
+        return None
+
+
+def write_atomic(path: Path, data: str | bytes) -> None:
+    """Replace ``path`` with ``data`` via a temporary sibling file.
+
+    A crash mid-write leaves the previous file intact instead of a truncated
+    one.  Text is written as UTF-8.  The ``.tmp`` suffix keeps a leftover
+    temporary file out of ``*.json`` scans.
+    """
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    if isinstance(data, str):
+        tmp_path.write_text(data, encoding="utf-8")
+    else:
+        tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def read_or_none(path: str | Path) -> bytes | None:
+    """Return the contents of ``path``, or None if it cannot be read."""
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except OSError as exc:
+        logger.debug("Skipping unreadable file %s: %s", path, exc)
+        return None
+
+
+def read_files_batched(
+    paths: Sequence[str | Path],
+) -> Iterator[tuple[str | Path, bytes]]:
+    """Yield ``(path, contents)`` for each readable file in ``paths``, in order.
+
+    The many small reads overlap on a thread pool while the caller parses on
+    its own thread.  Batches bound how many files are held in memory ahead of
+    the caller.  Unreadable files are skipped.
+    """
+    with ThreadPoolExecutor() as executor:
+        for start in range(0, len(paths), _READ_BATCH_SIZE):
+            batch = paths[start : start + _READ_BATCH_SIZE]
+            for path, raw in zip(batch, executor.map(read_or_none, batch)):
+                if raw is not None:
+                    yield path, raw
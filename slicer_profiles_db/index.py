@@ -32,6 +32,11 @@ class ProfileIndex:
         self._by_base_name: dict[
             SlicerType, dict[str, dict[str, list[StoredProfile]]]
         ] = {}
+        # Cross-vendor view of _by_base_name, built lazily on first lookup:
+        # {slicer: {base_name_lower: [(vendor, profiles)]}}
+        self._by_base_name_any_vendor: dict[
+            SlicerType, dict[str, list[tuple[str, list[StoredProfile]]]]
+        ] = {}
 
     def build(self, slicers: list[SlicerType] | None = None) -> None:
         """Build indexes from the store."""
@@ -40,9 +45,10 @@ class ProfileIndex:
         self._generics.clear()
         self._by_type.clear()
         self._by_base_name.clear()
+        self._by_base_name_any_vendor.clear()
 
         for slicer in slicers or list(SlicerType):
-            for profile in self.store.list_profiles(slicer):
+            for profile in self.store.iter_profiles(slicer):
                 self._index(slicer, profile)
 
     def _index(self, slicer: SlicerType, profile: StoredProfile) -> None:
@@ -77,6 +83,7 @@ class ProfileIndex:
             profile.vendor, {}
         ).setdefault(base_key, (base_name, []))
         self._by_base_name[slicer][profile.vendor][base_key][1].append(profile)
+        self._by_base_name_any_vendor.pop(slicer, None)
 
         # Index generics by vendor + filament_type
         filament_vendor = profile.get_latest("filament_vendor")
@@ -118,15 +125,16 @@ class ProfileIndex:
     ) -> list[tuple[str, list[StoredProfile]]]:
         """Search all vendors for a base profile name (case-insensitive).
 
-        Returns list of (vendor, profiles) tuples.
+        Returns list of (vendor, profiles) tuples, in vendor index order.
         """
-        key = base_name.lower()
-        results = []
-        for vendor, names in self._by_base_name.get(slicer, {}).items():
-            entry = names.get(key)
-            if entry:
-                results.append((vendor, entry[1]))
-        return results
+        by_key = self._by_base_name_any_vendor.get(slicer)
+        if by_key is None:
+            by_key = {}
+            for vendor, names in self._by_base_name.get(slicer, {}).items():
+                for key, (_, profiles) in names.items():
+                    by_key.setdefault(key, []).append((vendor, profiles))
+            self._by_base_name_any_vendor[slicer] = by_key
+        return list(by_key.get(base_name.lower(), ()))
 
     def find_by_type(
         self,
@@ -30,7 +30,7 @@ from .index import (
     is_profile_model_specific,
     resolve_generic_id,
 )
-from .matching import match_printer_model
+from .matching import PrinterModelIndex
 from .models import ProfileType, SlicerType, StoredProfile
 from .parsers.cura import (
     CURA_MATERIAL_RECOMPUTE_PLAN,
@@ -1319,6 +1319,8 @@ def map_printer_models(
         A ModelMap with model→profile mappings and a variant lookup map.
     """
     sp_brands, sp_models, sp_slicer_names = _prepare_sp_data(sp_data)
+    model_index = PrinterModelIndex(sp_models, sp_brands, sp_slicer_names)
+    known_brands = frozenset(sp_brands)
     result = ModelMap()
     slicers = slicers or _MAPPING_SLICERS
 
@@ -1347,16 +1349,7 @@ def map_printer_models(
                 )
             ids: set[int] = set()
             for compatible_name in dict.fromkeys(compatible_names):
-                ids.update(
-                    match_printer_model(
-                        sp_models,
-                        sp_brands,
-                        sp_slicer_names,
-                        vendor,
-                        compatible_name,
-                        brand_map,
-                    )
-                )
+                ids.update(model_index.match(vendor, compatible_name, brand_map))
 
             if ids:
                 profile_key = f"{vendor}/{profile.name}"
@@ -1366,7 +1359,7 @@ def map_printer_models(
                     ).append(profile_key)
             else:
                 normalized = normalize_brand(slicer, vendor)
-                if normalized not in sp_brands:
+                if normalized not in known_brands:
                     result.failed_brands.add(vendor)
                 else:
                     result.failed_models.add(f"{vendor}/{name}")
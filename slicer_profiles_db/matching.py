@@ -9,15 +9,21 @@ name without leaking into another brand.
 import re
 import unicodedata
 from collections.abc import Callable
+from dataclasses import dataclass, field
+from functools import lru_cache
 
 from .brands import strip_brand_from_name
 
 # Pre-compiled patterns used by multiple algorithms.
 _MMU_RE = re.compile(r"mmu[0-9]s?")
 _BED_SIZE_RE = re.compile(r"[0-9]+mm3?")
+_TRAILING_BED_SIZE_RE = re.compile(r" [0-9]{3,}$")
 _VORON_VERSION_RE = re.compile(r"v([0-9])")
 _WHITESPACE_RE = re.compile(r"\s+")
 
+# Translation table deleting parentheses in a single pass.
+_PAREN_TABLE = str.maketrans("", "", "()")
+
 
 def _normalise_name(value: str) -> str:
     """Return a stable form while retaining separators used by fuzzy rules."""
@@ -66,9 +72,7 @@ def remove_spaces(sp_name: str, slicer_name: str, brand: str) -> bool:
 
 
 def remove_parentheses(sp_name: str, slicer_name: str, brand: str) -> bool:
-    return sp_name.replace("(", "").replace(")", "") == slicer_name.replace(
-        "(", ""
-    ).replace(")", "")
+    return sp_name.translate(_PAREN_TABLE) == slicer_name.translate(_PAREN_TABLE)
 
 
 def remove_bltouch(sp_name: str, slicer_name: str, brand: str) -> bool:
@@ -102,38 +106,42 @@ def voron_version_convert(sp_name: str, slicer_name: str, brand: str) -> bool:
     return False
 
 
-def prusa_split_model_names(sp_name: str, slicer_name: str, brand: str) -> bool:
-    if brand != "prusa" or "&&" not in slicer_name:
-        return False
+@lru_cache(maxsize=4096)
+def _prusa_split_names(slicer_name: str) -> frozenset[str]:
+    """Return the model names packed into a ``&&``-joined Prusa printer name."""
     i3 = slicer_name.startswith("i3")
     if i3:
         slicer_name = slicer_name.removeprefix("i3").strip()
     slicer_name = re.sub(_MMU_RE, "", slicer_name).strip()
     slicer_name = slicer_name.replace("input shaper", "").strip()
-    split_names = slicer_name.split("&&")
-    for part in split_names:
-        candidate = part.strip()
-        if i3:
-            candidate = "i3 " + candidate
-        if sp_name == candidate:
-            return True
-    return False
+    return frozenset(
+        "i3 " + part.strip() if i3 else part.strip() for part in slicer_name.split("&&")
+    )
+
+
+def prusa_split_model_names(sp_name: str, slicer_name: str, brand: str) -> bool:
+    if brand != "prusa" or "&&" not in slicer_name:
+        return False
+    return sp_name in _prusa_split_names(slicer_name)
+
+
+@lru_cache(maxsize=4096)
+def _sovol_split_names(slicer_name: str) -> frozenset[str]:
+    """Return the model names packed into a ``/``-joined Sovol printer name."""
+    slicer_name = slicer_name.replace("bltouch", "").strip()
+    return frozenset(part.strip() for part in slicer_name.split("/"))
 
 
 def sovol_split_model_names(sp_name: str, slicer_name: str, brand: str) -> bool:
     if brand != "sovol" or "/" not in slicer_name:
         return False
-    slicer_name = slicer_name.replace("bltouch", "").strip()
-    for part in slicer_name.split("/"):
-        if sp_name == part.strip():
-            return True
-    return False
+    return sp_name in _sovol_split_names(slicer_name)
 
 
 def ratrig_vcore(sp_name: str, slicer_name: str, brand: str) -> bool:
     if brand != "rat rig" or not slicer_name.startswith("v-core"):
         return False
-    sp_name = sp_name.replace("(", "").replace(")", "")
+    sp_name = sp_name.translate(_PAREN_TABLE)
     slicer_name = slicer_name.replace("corexy ", "").replace("hybrid ", "")
     slicer_name = re.sub(r"-(?=[0-9])", " ", slicer_name)
     slicer_name = re.sub(r"3\.[0-9]", "3", slicer_name)
@@ -146,7 +154,38 @@ def ratrig_vcore(sp_name: str, slicer_name: str, brand: str) -> bool:
 
 
 def alternate_remove_bed_size(sp_name: str, slicer_name: str, brand: str) -> bool:
-    return sp_name == re.sub(r" [0-9]{3,}$", "", slicer_name)
+    return sp_name == re.sub(_TRAILING_BED_SIZE_RE, "", slicer_name)
+
+
+# Algorithms comparing the unchanged SimplyPrint name with a form of the slicer
+# name; ``_stripped_slicer_names`` produces all of those forms at once.
+_SLICER_STRIP_ALGOS = frozenset(
+    {
+        remove_bltouch,
+        remove_mmu,
+        remove_input_shaper,
+        remove_bed_size,
+        alternate_remove_bed_size,
+    }
+)
+
+
+def _stripped_slicer_names(slicer_name: str) -> frozenset[str]:
+    """Return the slicer-name forms tried by ``_SLICER_STRIP_ALGOS``.
+
+    The strips stay separate rather than one combined pattern: each
+    algorithm removes a single kind of token, and removing them all at
+    once would match names none of the algorithms match.
+    """
+    return frozenset(
+        (
+            slicer_name.replace("bltouch", "").strip(),
+            re.sub(_MMU_RE, "", slicer_name).strip(),
+            slicer_name.replace("input shaper", "").strip(),
+            re.sub(_BED_SIZE_RE, "", slicer_name).strip(),
+            re.sub(_TRAILING_BED_SIZE_RE, "", slicer_name),
+        )
+    )
 
 
 # Ordered list of all matching algorithms, tried in sequence.
@@ -169,6 +208,185 @@ CHECK_MODEL_ALGOS: list[Callable[[str, str, str], bool]] = [
 ]
 
 
+# Algorithms that rewrite both names the same way, with that rewrite.  A
+# candidate matches when its rewritten form equals the rewritten slicer name.
+_SYMMETRIC_REWRITES: tuple[
+    tuple[Callable[[str, str, str], bool], Callable[[str], str]], ...
+] = (
+    (remove_dashes, lambda name: name.replace("-", " ")),
+    (remove_spaces, lambda name: name.replace(" ", "")),
+    (remove_parentheses, lambda name: name.translate(_PAREN_TABLE)),
+)
+
+# Algorithms answered by PrinterModelIndex lookups rather than a candidate
+# sweep.  Only brand rules rewriting the SimplyPrint name are left to sweep.
+_INDEXED_ALGOS = frozenset(
+    {
+        direct_comparison,
+        normalised_comparison,
+        remove_repeated_brand,
+        prusa_split_model_names,
+        sovol_split_model_names,
+        *_SLICER_STRIP_ALGOS,
+        *(algo for algo, _rewrite in _SYMMETRIC_REWRITES),
+    }
+)
+
+
+@dataclass
+class _BrandCandidates:
+    """Brand-stripped SimplyPrint candidates for one (brand, original brand)."""
+
+    # stripped name -> model ids
+    exact: dict[str, set[int]] = field(default_factory=dict)
+    # non-empty ``_comparison_key`` of a stripped name -> model ids
+    comparison: dict[str, set[int]] = field(default_factory=dict)
+    # per ``_SYMMETRIC_REWRITES`` entry: rewritten stripped name -> model ids
+    rewritten: tuple[dict[str, set[int]], ...] = field(
+        default_factory=lambda: tuple({} for _ in _SYMMETRIC_REWRITES)
+    )
+    # (model_id, stripped candidate names)
+    models: list[tuple[int, tuple[str, ...]]] = field(default_factory=list)
+    # stripped printer name -> previously matched model ids
+    results: dict[str, frozenset[int]] = field(default_factory=dict)
+
+
+class PrinterModelIndex:
+    """Brand-grouped SimplyPrint model candidates for repeated matching.
+
+    Normalising and brand-stripping every canonical name and alias is the
+    expensive part of a match, and it only depends on the SimplyPrint data
+    and the (brand, original brand) pair.  The index does that work once per
+    pair and keys the stripped candidates by every form the generic
+    algorithms compare.  A query computes its own forms once and collects
+    the matching ids with one probe per form; only the brand rules that
+    rewrite the SimplyPrint name still sweep the brand's candidates.
+    """
+
+    def __init__(
+        self,
+        sp_models: list[dict],
+        sp_brands: list[str],
+        sp_slicer_names: dict[int, list[str]],
+    ):
+        self._brands = frozenset(_normalise_name(item) for item in sp_brands)
+        # normalised brand -> [(model_id, normalised candidate names)]
+        self._by_brand: dict[str, list[tuple[int, tuple[str, ...]]]] = {}
+        self._stripped: dict[tuple[str, str | None], _BrandCandidates] = {}
+        self._sweep_algos = [
+            algo for algo in CHECK_MODEL_ALGOS if algo not in _INDEXED_ALGOS
+        ]
+        self._build(sp_models, sp_slicer_names)
+
+    def _build(
+        self, sp_models: list[dict], sp_slicer_names: dict[int, list[str]]
+    ) -> None:
+        for model in sp_models:
+            model_id = model["id"]
+            candidates = [model.get("name", ""), *sp_slicer_names.get(model_id, [])]
+            names = tuple(
+                _normalise_name(candidate)
+                for candidate in candidates
+                if isinstance(candidate, str)
+            )
+            brand = _normalise_name(str(model.get("brand", "")))
+            self._by_brand.setdefault(brand, []).append((model_id, names))
+
+    def _stripped_candidates(
+        self, brand: str, old_brand: str | None
+    ) -> _BrandCandidates:
+        key = (brand, old_brand)
+        cached = self._stripped.get(key)
+        if cached is not None:
+            return cached
+
+        cached = self._stripped[key] = _BrandCandidates()
+        for model_id, names in self._by_brand.get(brand, ()):
+            stripped = tuple(
+                strip_brand_from_name(name, brand, old_brand) for name in names
+            )
+            for name in stripped:
+                cached.exact.setdefault(name, set()).add(model_id)
+                comparison_key = _comparison_key(name)
+                if comparison_key:
+                    cached.comparison.setdefault(comparison_key, set()).add(model_id)
+                for (_algo, rewrite), table in zip(
+                    _SYMMETRIC_REWRITES, cached.rewritten
+                ):
+                    table.setdefault(rewrite(name), set()).add(model_id)
+            cached.models.append((model_id, stripped))
+        return cached
+
+    def match(
+        self, brand: str, printer_name: str, brand_map: dict[str, str]
+    ) -> set[int]:
+        """Return the SimplyPrint model IDs matching a slicer printer name.
+
+        See :func:`match_printer_model` for the meaning of the arguments.
+        """
+        printer_name = _normalise_name(printer_name)
+        brand = _normalise_name(brand)
+        old_brand: str | None = None
+
+        # Map slicer brand → SimplyPrint brand
+        normalised_brand_map = {
+            _normalise_name(source): _normalise_name(target)
+            for source, target in brand_map.items()
+        }
+        if brand in normalised_brand_map:
+            old_brand = brand
+            brand = normalised_brand_map[brand]
+
+        if brand not in self._brands:
+            return set()
+
+        # Strip brand prefix from printer name
+        printer_name = strip_brand_from_name(printer_name, brand, old_brand)
+
+        # Canonical names and aliases are both brand-owned candidates.  Keeping
+        # them grouped by brand prevents an alias belonging to another brand
+        # from being returned merely because its text happens to match.
+        candidates = self._stripped_candidates(brand, old_brand)
+        # Forks share most printer names, so the same query recurs per slicer
+        known = candidates.results.get(printer_name)
+        if known is not None:
+            return set(known)
+
+        # Forms of the slicer name compared with unchanged candidate names
+        exact_forms = {printer_name, *_stripped_slicer_names(printer_name)}
+        if brand == "prusa" and "&&" in printer_name:
+            exact_forms.update(_prusa_split_names(printer_name))
+        if brand == "sovol" and "/" in printer_name:
+            exact_forms.update(_sovol_split_names(printer_name))
+
+        comparison_keys = [_comparison_key(printer_name)]
+        if printer_name.startswith(brand):
+            comparison_keys.append(_comparison_key(printer_name[len(brand) :].strip()))
+
+        ids: set[int] = set()
+        for form in exact_forms:
+            ids.update(candidates.exact.get(form, ()))
+        for comparison_key in comparison_keys:
+            ids.update(candidates.comparison.get(comparison_key, ()))
+        for (_algo, rewrite), table in zip(_SYMMETRIC_REWRITES, candidates.rewritten):
+            ids.update(table.get(rewrite(printer_name), ()))
+
+        if self._sweep_algos:
+            for model_id, names in candidates.models:
+                if model_id in ids:
+                    continue
+                for candidate_name in names:
+                    if any(
+                        algo(candidate_name, printer_name, brand)
+                        for algo in self._sweep_algos
+                    ):
+                        ids.add(model_id)
+                        break
+
+        candidates.results[printer_name] = frozenset(ids)
+        return ids
+
+
 def match_printer_model(
     sp_models: list[dict],
     sp_brands: list[str],
@@ -180,6 +398,9 @@ def match_printer_model(
     """
     Run all matching algorithms against SimplyPrint models, return matching IDs.
 
+    Callers matching many printer names against the same SimplyPrint data
+    should build a :class:`PrinterModelIndex` once and call its ``match``.
+
     Args:
         sp_models: SimplyPrint model list (each with 'id', 'brand', 'name').
         sp_brands: List of SimplyPrint brand names.
@@ -191,46 +412,6 @@ def match_printer_model(
     Returns:
         Set of matched SimplyPrint model IDs (may be empty).
     """
-    printer_name = _normalise_name(printer_name)
-    brand = _normalise_name(brand)
-    old_brand: str | None = None
-
-    # Map slicer brand → SimplyPrint brand
-    normalised_brand_map = {
-        _normalise_name(source): _normalise_name(target)
-        for source, target in brand_map.items()
-    }
-    if brand in normalised_brand_map:
-        old_brand = brand
-        brand = normalised_brand_map[brand]
-
-    if brand not in {_normalise_name(item) for item in sp_brands}:
-        return set()
-
-    # Strip brand prefix from printer name
-    printer_name = strip_brand_from_name(printer_name, brand, old_brand)
-
-    ids: set[int] = set()
-
-    # Canonical names and aliases are both brand-owned candidates.  Keeping
-    # them inside this loop prevents an alias belonging to another brand from
-    # being returned merely because its text happens to match.
-    for model in sp_models:
-        if _normalise_name(str(model.get("brand", ""))) != brand:
-            continue
-
-        model_id = model["id"]
-        candidates = [model.get("name", ""), *sp_slicer_names.get(model_id, [])]
-        for candidate in candidates:
-            if not isinstance(candidate, str):
-                continue
-            candidate_name = strip_brand_from_name(
-                _normalise_name(candidate), brand, old_brand
-            )
-            if any(
-                algo(candidate_name, printer_name, brand) for algo in CHECK_MODEL_ALGOS
-            ):
-                ids.add(model_id)
-                break
-
-    return ids
+    return PrinterModelIndex(sp_models, sp_brands, sp_slicer_names).match(
+        brand, printer_name, brand_map
+    )
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+from bisect import bisect_right
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class SlicerType(str, Enum):
@@ -26,6 +28,11 @@ class ProfileType(str, Enum):
     PRINT = "print"
 
 
+# Maps the secondary version separators onto '.' so a plain split suffices.
+_VERSION_SEPARATORS = str.maketrans("-_", "..")
+
+
+@lru_cache(maxsize=4096)
 def _version_key(v: str) -> tuple[int, ...]:
     """Convert a version string to a comparable tuple of ints.
 
@@ -33,11 +40,12 @@ def _version_key(v: str) -> tuple[int, ...]:
     This is the single source of truth for version ordering throughout the
     slicer module.  Imported here so StoredProfile can use it without
     depending on versions.py (which imports models.py).
-    """
-    import re
 
+    Results are cached: a store only ever holds a handful of distinct
+    version strings, but they are compared once per setting entry.
+    """
     parts: list[int] = []
-    for part in re.split(r"[.\-_]", v):
+    for part in v.translate(_VERSION_SEPARATORS).split("."):
         try:
             parts.append(int(part))
         except ValueError:
@@ -98,38 +106,48 @@ class StoredProfile(BaseModel):
     setting_scopes: dict[str, str] = Field(default_factory=dict)
     settings: dict[str, dict[str, Any]] = Field(default_factory=dict)
 
+    # key -> (version dict, its size, sorted version keys, matching values).
+    # Rebuilt when the key's version dict is replaced or grows.  Overwrite an
+    # existing entry through set_setting(), which drops the cached order.
+    _sorted_settings: dict[
+        str, tuple[dict[str, Any], int, tuple[tuple[int, ...], ...], tuple[Any, ...]]
+    ] = PrivateAttr(default_factory=dict)
+
+    def set_setting(self, key: str, version: str, value: Any) -> None:
+        """Record ``value`` for ``key`` at ``version``, replacing any entry."""
+        self.settings.setdefault(key, {})[version] = value
+        self._sorted_settings.pop(key, None)
+
     def get_latest(self, key: str) -> Any:
         """Get the most recent value for a setting key."""
         versions = self.settings.get(key)
         if not versions:
             return None
-        return list(versions.values())[-1]
+        return next(reversed(versions.values()))
 
     def get_at_version(self, key: str, version: str) -> Any:
         """Get the value of a setting at a specific version.
 
-        Walks all version entries for the key and returns the value from
-        the latest version that is <= the requested version (using semantic
-        comparison via ``_version_key``).
+        Returns the value from the latest version that is <= the requested
+        version (using semantic comparison via ``_version_key``).
         """
         versions = self.settings.get(key)
         if not versions:
             return None
-        target = _version_key(version)
-        result = None
-        for ver, val in versions.items():
-            if _version_key(ver) <= target:
-                result = val
-        return result
+        return self._value_at(key, versions, _version_key(version))[1]
 
     def changed_settings(
         self, from_version: str, to_version: str
     ) -> dict[str, tuple[Any, Any]]:
         """Return settings that changed between two versions: { key: (old_value, new_value) }."""
+        from_target = _version_key(from_version)
+        to_target = _version_key(to_version)
         changes: dict[str, tuple[Any, Any]] = {}
-        for key in self.settings:
-            old_val = self.get_at_version(key, from_version)
-            new_val = self.get_at_version(key, to_version)
+        for key, versions in self.settings.items():
+            if not versions:
+                continue
+            old_val = self._value_at(key, versions, from_target)[1]
+            new_val = self._value_at(key, versions, to_target)[1]
             if old_val != new_val:
                 changes[key] = (old_val, new_val)
         return changes
@@ -144,18 +162,36 @@ class StoredProfile(BaseModel):
         target = _version_key(version)
         snapshot: dict[str, Any] = {}
         for key, versions in self.settings.items():
-            value = None
-            found = False
-            for ver, val in versions.items():
-                if _version_key(ver) <= target:
-                    value = val
-                    found = True
+            found, value = self._value_at(key, versions, target)
             # ``None`` is the store's tombstone for settings removed in a
             # later slicer release.  Omit tombstoned keys from snapshots.
             if found and value is not None:
                 snapshot[key] = value
         return snapshot
 
+    def _value_at(
+        self, key: str, versions: dict[str, Any], target: tuple[int, ...]
+    ) -> tuple[bool, Any]:
+        """Return ``(found, value)`` for the latest entry at or before *target*."""
+        cached = self._sorted_settings.get(key)
+        if cached is None or cached[0] is not versions or cached[1] != len(versions):
+            # Stable sort: equal version keys keep their insertion order
+            pairs = sorted(
+                ((_version_key(ver), val) for ver, val in versions.items()),
+                key=lambda pair: pair[0],
+            )
+            cached = (
+                versions,
+                len(versions),
+                tuple(pair[0] for pair in pairs),
+                tuple(pair[1] for pair in pairs),
+            )
+            self._sorted_settings[key] = cached
+        idx = bisect_right(cached[2], target) - 1
+        if idx < 0:
+            return False, None
+        return True, cached[3][idx]
+
 
 class IngestionReport(BaseModel):
     """Result of ingesting a new slicer version into the store."""
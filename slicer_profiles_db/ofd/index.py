@@ -69,6 +69,10 @@ class OFDFilamentIndex:
     - ``by_slicer_profile``: (slicer, lowercase profile_name) -> OFDFilament
     - ``by_slicer_id``: (slicer, slicer_id) -> OFDFilament
     - ``by_brand_material_name``: (brand_name_lower, material_upper, filament_name_lower) -> OFDFilament
+
+    ``_brands_by_first_token`` maps the first lowercase word of every brand
+    to the lowercase brand names starting with it (shortest first), so the
+    brand decomposition strategy only tries prefixes naming a known brand.
     """
 
     def __init__(self, repo: OFDRepo):
@@ -76,6 +80,7 @@ class OFDFilamentIndex:
         self.by_slicer_profile: dict[str, dict[str, OFDFilament]] = {}
         self.by_slicer_id: dict[str, dict[str, OFDFilament]] = {}
         self.by_brand_material_name: dict[tuple[str, str, str], OFDFilament] = {}
+        self._brands_by_first_token: dict[str, list[tuple[int, str]]] = {}
         self._build(repo)
 
     def _build(self, repo: OFDRepo) -> None:
@@ -84,32 +89,37 @@ class OFDFilamentIndex:
             self.by_path[fil.fs_path] = fil
 
             # By brand/material/name tuple
-            key = (
-                fil.brand_name.lower(),
-                fil.material.upper(),
-                fil.filament_name.lower(),
-            )
+            key = (fil.brand_name_lower, fil.material_upper, fil.filament_name_lower)
             self.by_brand_material_name[key] = fil
 
-            # By slicer profile name (from slicer_settings)
-            for slicer, settings in fil.slicer_settings.items():
-                profile_name = settings.get("profile_name")
-                if profile_name:
-                    self.by_slicer_profile.setdefault(slicer, {})[
-                        profile_name.lower()
-                    ] = fil
+            # By first brand token (brand decomposition prefilter)
+            brand_tokens = key[0].split()
+            if brand_tokens:
+                brands = self._brands_by_first_token.setdefault(brand_tokens[0], [])
+                entry = (len(brand_tokens), key[0])
+                if entry not in brands:
+                    brands.append(entry)
 
             # By slicer ID (from slicer_ids)
             for slicer, sid in fil.slicer_ids.items():
                 if sid:
                     self.by_slicer_id.setdefault(slicer, {})[sid] = fil
 
-            # Also index IDs from slicer_settings (migrated format)
+            # By slicer profile name, and IDs in the migrated format, from
+            # slicer_settings.  Legacy slicer_ids above take precedence.
             for slicer, settings in fil.slicer_settings.items():
+                profile_name = settings.get("profile_name")
+                if profile_name:
+                    self.by_slicer_profile.setdefault(slicer, {})[
+                        profile_name.lower()
+                    ] = fil
                 sid = settings.get("id")
                 if sid:
                     self.by_slicer_id.setdefault(slicer, {}).setdefault(sid, fil)
 
+        for brands in self._brands_by_first_token.values():
+            brands.sort()
+
         logger.info(
             "OFD index: %d paths, %d profile names, %d slicer IDs, %d brand/material/name",
             len(self.by_path),
@@ -145,17 +155,18 @@ class OFDFilamentIndex:
             OFD filesystem path (e.g. "bambu_lab/PLA/aero") or None.
         """
         # Strip " @printer" suffix — OFD stores base names only
-        base_name = (
-            profile_name.split(" @")[0] if " @" in profile_name else profile_name
-        )
+        base_name = profile_name.partition(" @")[0]
+        base_name_lower = base_name.lower()
+        material_upper = filament_type.upper() if filament_type else ""
 
         # Sanitise filament_id — some slicers store profile names as IDs
-        if filament_id and (" @" in filament_id or " " in filament_id):
+        # (" @printer" suffixes included: any space rules the ID out)
+        if filament_id and " " in filament_id:
             filament_id = None
 
         # Strategy 1: By slicer profile name (exact match on base name)
         slicer_profiles = self.by_slicer_profile.get(slicer, {})
-        fil = slicer_profiles.get(base_name.lower())
+        fil = slicer_profiles.get(base_name_lower)
         if fil and _sub_variants_compatible(fil.filament_id, profile_name):
             return fil.fs_path
 
@@ -165,44 +176,40 @@ class OFDFilamentIndex:
         if filament_id:
             slicer_ids = self.by_slicer_id.get(slicer, {})
             fil = slicer_ids.get(filament_id)
-            if fil and _sub_variants_compatible(fil.filament_id, profile_name):
-                bn_lower = base_name.lower()
-                brand_lower = fil.brand_name.lower()
-                if (
-                    brand_lower in bn_lower
-                    or fil.brand_id.replace("_", " ") in bn_lower
-                ):
-                    return fil.fs_path
+            if (
+                fil
+                and _sub_variants_compatible(fil.filament_id, profile_name)
+                and (
+                    fil.brand_name_lower in base_name_lower
+                    or fil.brand_id.replace("_", " ") in base_name_lower
+                )
+            ):
+                return fil.fs_path
 
         # Strategy 3: Brand/material/name decomposition
         # base_name is typically "{Brand} {MATERIAL} {Name}" or "{Brand} {MATERIAL}"
         parts = base_name.split()
         if len(parts) >= 2:
-            material_upper = filament_type.upper() if filament_type else ""
-            for i in range(1, len(parts)):
-                candidate_brand = " ".join(parts[:i]).lower()
-                remaining = parts[i:]
-                # Check if remaining starts with material
-                if (
-                    remaining
-                    and remaining[0].upper() == material_upper
-                    and len(remaining) > 1
-                ):
-                    candidate_name = " ".join(remaining[1:]).lower()
-                    key = (candidate_brand, material_upper, candidate_name)
-                    fil = self.by_brand_material_name.get(key)
-                    if fil and _sub_variants_compatible(fil.filament_id, profile_name):
-                        return fil.fs_path
-                # When name equals material or material is embedded in name
-                if (
-                    remaining
-                    and remaining[0].upper() == material_upper
-                    and len(remaining) == 1
-                ):
-                    key = (candidate_brand, material_upper, material_upper.lower())
-                    fil = self.by_brand_material_name.get(key)
-                    if fil and _sub_variants_compatible(fil.filament_id, profile_name):
-                        return fil.fs_path
+            parts_lower = base_name_lower.split()
+            for token_count, candidate_brand in self._brands_by_first_token.get(
+                parts_lower[0], ()
+            ):
+                # The brand must leave at least the material token behind
+                if token_count >= len(parts):
+                    break
+                if " ".join(parts_lower[:token_count]) != candidate_brand:
+                    continue
+                if parts[token_count].upper() != material_upper:
+                    continue
+                if token_count + 1 < len(parts):
+                    candidate_name = " ".join(parts_lower[token_count + 1 :])
+                else:
+                    # When name equals material or material is embedded in name
+                    candidate_name = material_upper.lower()
+                key = (candidate_brand, material_upper, candidate_name)
+                fil = self.by_brand_material_name.get(key)
+                if fil and _sub_variants_compatible(fil.filament_id, profile_name):
+                    return fil.fs_path
 
         return None
 
@@ -4,14 +4,18 @@ SlicerMapper: derives slicer_settings/slicer_ids mappings from profile store dat
 Ported from ofd.slicer_mapper.mapper — this is the canonical implementation.
 """
 
+import functools
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 
 from slicer_profiles_db import ProfileIndex, SlicerType, StoredProfile
+from slicer_profiles_db.fileio import write_atomic
 from slicer_profiles_db.index import build_generic_profile_index, resolve_generic_id
 
+from .repo import read_brand_name, read_if_exists, sorted_subdirs
 from .vendor_map import get_profile_prefixes
 
 logger = logging.getLogger(__name__)
@@ -70,55 +74,62 @@ class SlicerMapper:
         if slicers is None:
             slicers = [s.value for s in SlicerType]
 
+        slicer_types = [SlicerType(s) for s in slicers]
+
         # Build generic profile index for generic_id resolution
-        generic_profiles = build_generic_profile_index(
-            self.index, [SlicerType(s) for s in slicers]
-        )
+        generic_profiles = build_generic_profile_index(self.index, slicer_types)
+        # Generics grouped by filament type (order kept), so each material
+        # directory only hands its own type's entries to resolve_generic_id
+        targets: list[
+            tuple[str, SlicerType, dict[str, list[tuple[str, str, str]]]]
+        ] = []
+        for slicer, slicer_type in zip(slicers, slicer_types):
+            by_type: dict[str, list[tuple[str, str, str]]] = {}
+            for entry in generic_profiles.get(slicer, []):
+                by_type.setdefault(entry[1], []).append(entry)
+            targets.append((slicer, slicer_type, by_type))
 
         report = MappingReport()
+        # filament.json path -> (raw bytes, parsed data), reused when writing
+        documents: dict[Path, tuple[bytes, dict]] = {}
 
-        for brand_dir in sorted(self.data_dir.iterdir()):
-            if not brand_dir.is_dir():
-                continue
-
+        for brand_dir in sorted_subdirs(self.data_dir):
             brand_id = brand_dir.name
             if brand_filter and brand_id != brand_filter:
                 continue
 
-            brand_json = brand_dir / "brand.json"
-            if not brand_json.exists():
+            brand_name = read_brand_name(brand_dir)
+            if brand_name is None:
                 continue
+            prefixes = get_profile_prefixes(brand_id, brand_name)
 
-            brand_data = json.loads(brand_json.read_text(encoding="utf-8"))
-            brand_name = brand_data.get("name", "")
-
-            for material_dir in sorted(brand_dir.iterdir()):
-                if not material_dir.is_dir():
-                    continue
-
+            for material_dir in sorted_subdirs(brand_dir):
                 material = material_dir.name
-
-                for filament_dir in sorted(material_dir.iterdir()):
-                    if not filament_dir.is_dir():
+                material_upper = material.upper()
+                material_targets = [
+                    (slicer, slicer_type, by_type.get(material_upper, []))
+                    for slicer, slicer_type, by_type in targets
+                ]
+
+                for filament_dir in sorted_subdirs(material_dir):
+                    filament_path = Path(filament_dir.path, "filament.json")
+                    raw = read_if_exists(filament_path)
+                    if raw is None:
                         continue
-
-                    filament_path = filament_dir / "filament.json"
-                    if not filament_path.exists():
-                        continue
-
-                    filament_data = json.loads(
-                        filament_path.read_text(encoding="utf-8")
+                    filament_data = json.loads(raw)
+                    documents[filament_path] = (raw, filament_data)
+                    candidates = self._filament_candidates(
+                        prefixes, material, filament_data.get("name", "")
                     )
 
-                    for slicer in slicers:
+                    for slicer, slicer_type, generics in material_targets:
                         result = self._match_filament(
-                            brand_id=brand_id,
-                            brand_name=brand_name,
-                            material=material,
-                            filament_data=filament_data,
+                            candidates=candidates,
+                            material_upper=material_upper,
                             filament_path=filament_path,
                             slicer=slicer,
-                            generic_profiles=generic_profiles,
+                            slicer_type=slicer_type,
+                            generics=generics,
                         )
                         if result is None:
                             report.skipped.append(
@@ -153,70 +164,74 @@ class SlicerMapper:
         if not dry_run:
             # Write all results (updated + already_correct) to ensure
             # generic_id is added and slicer_ids are migrated everywhere.
-            self._write_updates(report.updated + report.already_correct)
+            self._write_updates(report.updated + report.already_correct, documents)
 
         return report
 
     def _match_filament(
         self,
-        brand_id: str,
-        brand_name: str,
-        material: str,
-        filament_data: dict,
+        candidates: tuple[str, ...],
+        material_upper: str,
         filament_path: Path,
         slicer: str,
-        generic_profiles: dict[str, list[tuple[str, str, str]]] | None = None,
+        slicer_type: SlicerType,
+        generics: list[tuple[str, str, str]] | None = None,
     ) -> MappingResult | None:
         """Try to match a filament to a slicer profile base name.
 
-        Searches across ALL vendors for the slicer, using candidate
-        profile names derived from the brand name and filament metadata.
+        Searches across ALL vendors for the slicer, trying each of the
+        filament's ``candidates`` (see :meth:`_filament_candidates`) in order.
+        ``generics`` holds the slicer's entries from
+        :func:`build_generic_profile_index` for ``material_upper``.
         """
-        prefixes = get_profile_prefixes(brand_id, brand_name)
-        if not prefixes:
-            return None
-
-        filament_name = filament_data.get("name", "")
-
-        try:
-            slicer_type = SlicerType(slicer)
-        except ValueError:
-            return None
+        for candidate in candidates:
+            matches = self.index.find_by_base_name_any_vendor(slicer_type, candidate)
+            if matches:
+                vendor, profiles = matches[0]
+                profile_base_name = profiles[0].name.split(" @")[0]
+                slicer_id = _best_slicer_id(profiles)
+
+                # Resolve generic_id from the profile's filament_type
+                gid = None
+                if generics:
+                    gid = resolve_generic_id(
+                        generics,
+                        material_upper,
+                        profile_base_name,
+                    )
 
-        for prefix in prefixes:
-            candidates = self._compose_candidates(prefix, material, filament_name)
-            for candidate in candidates:
-                matches = self.index.find_by_base_name_any_vendor(
-                    slicer_type, candidate
+                return MappingResult(
+                    filament_path=filament_path,
+                    slicer=slicer,
+                    profile_name=profile_base_name,
+                    slicer_id=slicer_id,
+                    generic_id=gid,
+                    vendor=vendor,
                 )
-                if matches:
-                    vendor, profiles = matches[0]
-                    profile_base_name = profiles[0].name.split(" @")[0]
-                    slicer_id = _best_slicer_id(profiles)
-
-                    # Resolve generic_id from the profile's filament_type
-                    gid = None
-                    if generic_profiles:
-                        gid = resolve_generic_id(
-                            generic_profiles.get(slicer, []),
-                            material.upper(),
-                            profile_base_name,
-                        )
-
-                    return MappingResult(
-                        filament_path=filament_path,
-                        slicer=slicer,
-                        profile_name=profile_base_name,
-                        slicer_id=slicer_id,
-                        generic_id=gid,
-                        vendor=vendor,
-                    )
 
         return None
 
+    @classmethod
+    def _filament_candidates(
+        cls, prefixes: list[str], material: str, filament_name: str
+    ) -> tuple[str, ...]:
+        """Candidate base names for a filament across all brand ``prefixes``.
+
+        Keeps the probe order of :meth:`_compose_candidates` per prefix but
+        drops names that differ only by case, since the index lookup is
+        case-insensitive and a repeated probe can never match.
+        """
+        unique: dict[str, str] = {}
+        for prefix in prefixes:
+            for candidate in cls._compose_candidates(prefix, material, filament_name):
+                unique.setdefault(candidate.lower(), candidate)
+        return tuple(unique.values())
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def _compose_candidates(
-        self, prefix: str, material: str, filament_name: str
-    ) -> list[str]:
+        prefix: str, material: str, filament_name: str
+    ) -> tuple[str, ...]:
         """
         Generate candidate base profile names to search for.
 
@@ -226,6 +241,8 @@ class SlicerMapper:
         3. "Bambu Support Matte" (support material pattern)
         4. "Bambu Matte" (prefix + name, for names that embed material)
         5. "Bambu PLA" (just prefix + material, when name matches material)
+
+        Cached, since every slicer asks for the same candidates.
         """
         material_upper = material.upper()
         candidates = []
@@ -257,20 +274,35 @@ class SlicerMapper:
         if not filament_name or filament_name.upper() == material_upper:
             candidates.append(f"{prefix} {material_upper}")
 
-        return candidates
+        return tuple(candidates)
 
-    def _write_updates(self, results: list[MappingResult]) -> None:
+    def _write_updates(
+        self,
+        results: list[MappingResult],
+        documents: dict[Path, tuple[bytes, dict]] | None = None,
+    ) -> None:
         """Write id, generic_id, and profile_name into slicer_settings in filament.json files.
 
         Also migrates any legacy slicer_ids entries into slicer_settings and
         removes the top-level slicer_ids block.
+
+        ``documents`` maps paths already read by :meth:`run` to their raw bytes
+        and parsed data, so those files are not read again. Files whose
+        serialized output is unchanged are left untouched; the others are
+        replaced atomically, with the writes overlapped on a thread pool.
         """
         by_path: dict[Path, list[MappingResult]] = {}
         for r in results:
             by_path.setdefault(r.filament_path, []).append(r)
 
+        writes: list[tuple[Path, bytes]] = []
         for path, mappings in by_path.items():
-            data = json.loads(path.read_text(encoding="utf-8"))
+            cached = documents.get(path) if documents else None
+            if cached is None:
+                raw = path.read_bytes()
+                data = json.loads(raw)
+            else:
+                raw, data = cached
 
             # Migrate any existing slicer_ids into slicer_settings
             if "slicer_ids" in data:
@@ -290,7 +322,13 @@ class SlicerMapper:
                 if m.generic_id:
                     ss["generic_id"] = m.generic_id
 
-            path.write_text(
-                json.dumps(data, indent=4, ensure_ascii=False) + "\n",
-                encoding="utf-8",
+            payload = (json.dumps(data, indent=4, ensure_ascii=False) + "\n").encode(
+                "utf-8"
             )
+            if payload != raw:
+                writes.append((path, payload))
+
+        with ThreadPoolExecutor() as pool:
+            futures = [pool.submit(write_atomic, *write) for write in writes]
+        for future in futures:
+            future.result()
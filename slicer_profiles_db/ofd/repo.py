@@ -4,14 +4,60 @@ OFDRepo: reads OFD filament data from a local checkout of the data/ directory.
 
 from __future__ import annotations
 
+import functools
 import json
 import logging
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
 
+def sorted_subdirs(path: str | os.PathLike[str]) -> list[os.DirEntry[str]]:
+    """Return the subdirectories of ``path`` sorted by name.
+
+    Uses ``os.scandir`` so the directory check comes from the cached entry
+    type instead of a separate ``stat`` per child.
+    """
+    with os.scandir(path) as entries:
+        return sorted((e for e in entries if e.is_dir()), key=lambda e: e.name)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_brand_name(path: str, mtime_ns: int, size: int) -> str:
+    return json.loads(Path(path).read_bytes()).get("name", "")
+
+
+def read_brand_name(brand_dir: str | os.PathLike[str]) -> str | None:
+    """Return the name from ``brand_dir``'s brand.json, or None if it is missing.
+
+    Parsed names are cached by path, mtime and size, so the mapper and the
+    repo loader (or repeated loads in one process) read each file once.
+    """
+    path = os.path.join(brand_dir, "brand.json")
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return _parse_brand_name(path, stat.st_mtime_ns, stat.st_size)
+
+
+def _intern_keys(mapping: dict) -> dict:
+    """Return ``mapping`` with its (slicer name) keys interned."""
+    return {sys.intern(key): value for key, value in mapping.items()}
+
+
+def read_if_exists(path: Path) -> bytes | None:
+    """Return the contents of ``path``, or None if the file does not exist."""
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        return None
+
+
 @dataclass
 class OFDFilament:
     """A single filament entry from the OFD repository."""
@@ -25,6 +71,17 @@ class OFDFilament:
     slicer_settings: dict = field(default_factory=dict)
     slicer_ids: dict = field(default_factory=dict)
 
+    # Case-folded lookup forms, derived once for the index
+    brand_name_lower: str = field(init=False, repr=False, compare=False)
+    material_upper: str = field(init=False, repr=False, compare=False)
+    filament_name_lower: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Brand and material forms repeat across thousands of filaments
+        self.brand_name_lower = sys.intern(self.brand_name.lower())
+        self.material_upper = sys.intern(self.material.upper())
+        self.filament_name_lower = self.filament_name.lower()
+
 
 class OFDRepo:
     """Read-only access to an OFD data/ directory.
@@ -46,50 +103,57 @@ class OFDRepo:
         if not self.data_dir.is_dir():
             raise FileNotFoundError(f"OFD data directory not found: {self.data_dir}")
 
-        for brand_dir in sorted(self.data_dir.iterdir()):
-            if not brand_dir.is_dir():
-                continue
-
-            brand_json = brand_dir / "brand.json"
-            if not brand_json.exists():
+        # (brand_id, brand_name, material, filament_id, filament.json path)
+        entries: list[tuple[str, str, str, str, Path]] = []
+        for brand_dir in sorted_subdirs(self.data_dir):
+            brand_name = read_brand_name(brand_dir)
+            if brand_name is None:
                 continue
-
-            brand_data = json.loads(brand_json.read_text(encoding="utf-8"))
-            brand_id = brand_dir.name
-            brand_name = brand_data.get("name", "")
-
-            for material_dir in sorted(brand_dir.iterdir()):
-                if not material_dir.is_dir():
-                    continue
-
-                material = material_dir.name
-
-                for filament_dir in sorted(material_dir.iterdir()):
-                    if not filament_dir.is_dir():
-                        continue
-
-                    filament_path = filament_dir / "filament.json"
-                    if not filament_path.exists():
-                        continue
-
-                    filament_data = json.loads(
-                        filament_path.read_text(encoding="utf-8")
-                    )
-                    filament_id = filament_dir.name
-                    filament_name = filament_data.get("name", filament_id)
-                    fs_path = f"{brand_id}/{material}/{filament_id}"
-
-                    self.filaments.append(
-                        OFDFilament(
-                            brand_id=brand_id,
-                            brand_name=brand_name,
-                            material=material,
-                            filament_id=filament_id,
-                            filament_name=filament_name,
-                            fs_path=fs_path,
-                            slicer_settings=filament_data.get("slicer_settings", {}),
-                            slicer_ids=filament_data.get("slicer_ids", {}),
+            if isinstance(brand_name, str):
+                brand_name = sys.intern(brand_name)
+            brand_id = sys.intern(brand_dir.name)
+
+            for material_dir in sorted_subdirs(brand_dir):
+                material = sys.intern(material_dir.name)
+
+                for filament_dir in sorted_subdirs(material_dir):
+                    entries.append(
+                        (
+                            brand_id,
+                            brand_name,
+                            material,
+                            filament_dir.name,
+                            Path(filament_dir.path, "filament.json"),
                         )
                     )
 
+        # Overlap the reads of the many small filament.json files; parsing
+        # stays sequential so the filaments keep their walk order.
+        with ThreadPoolExecutor() as pool:
+            contents = list(pool.map(read_if_exists, [e[4] for e in entries]))
+
+        for (brand_id, brand_name, material, filament_id, _), raw in zip(
+            entries, contents
+        ):
+            if raw is None:
+                continue
+            filament_data = json.loads(raw)
+            filament_name = filament_data.get("name", filament_id)
+            fs_path = f"{brand_id}/{material}/{filament_id}"
+
+            self.filaments.append(
+                OFDFilament(
+                    brand_id=brand_id,
+                    brand_name=brand_name,
+                    material=material,
+                    filament_id=filament_id,
+                    filament_name=filament_name,
+                    fs_path=fs_path,
+                    slicer_settings=_intern_keys(
+                        filament_data.get("slicer_settings", {})
+                    ),
+                    slicer_ids=_intern_keys(filament_data.get("slicer_ids", {})),
+                )
+            )
+
         logger.info("Loaded %d filaments from OFD", len(self.filaments))
@@ -1,12 +1,16 @@
-from .anycubicslicer import AnycubicSlicerParser
-from .bambustudio import BambuStudioParser
-from .crealityprint import CrealityPrintParser
-from .cura import CuraParser
-from .elegooslicer import ElegooSlicerParser
-from .kirimoto import KiriMotoParser
-from .orcaslicer import OrcaSlicerParser
-from .prusaslicer import PrusaSlicerParser
-from .superslicer import SuperSlicerParser
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .anycubicslicer import AnycubicSlicerParser
+    from .bambustudio import BambuStudioParser
+    from .crealityprint import CrealityPrintParser
+    from .cura import CuraParser
+    from .elegooslicer import ElegooSlicerParser
+    from .kirimoto import KiriMotoParser
+    from .orcaslicer import OrcaSlicerParser
+    from .prusaslicer import PrusaSlicerParser
+    from .superslicer import SuperSlicerParser
 
 __all__ = [
     "AnycubicSlicerParser",
@@ -19,3 +23,30 @@ __all__ = [
     "PrusaSlicerParser",
     "SuperSlicerParser",
 ]
+
+# Parser classes are imported on first access (PEP 562), so importing one
+# parser does not pull in every other slicer's module.
+_PARSER_MODULES = {
+    "AnycubicSlicerParser": ".anycubicslicer",
+    "BambuStudioParser": ".bambustudio",
+    "CrealityPrintParser": ".crealityprint",
+    "CuraParser": ".cura",
+    "ElegooSlicerParser": ".elegooslicer",
+    "KiriMotoParser": ".kirimoto",
+    "OrcaSlicerParser": ".orcaslicer",
+    "PrusaSlicerParser": ".prusaslicer",
+    "SuperSlicerParser": ".superslicer",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _PARSER_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    parser_class = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = parser_class
+    return parser_class
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
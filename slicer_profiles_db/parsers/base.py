@@ -1,12 +1,85 @@
+import itertools
 import logging
+import os
+import sys
 from abc import ABC, abstractmethod
-from collections.abc import Iterator
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Any
 
+from ..fileio import iter_files
 from ..models import ParsedProfile, ProfileType, SlicerType
 
 logger = logging.getLogger(__name__)
 
+# Below this many files, starting worker processes costs more than it saves.
+_PARALLEL_MIN_FILES = 200
+
+# Settings key holding a profile's own name, for types that have one.
+_SETTINGS_ID_KEYS: dict[ProfileType, str] = {
+    ProfileType.FILAMENT: "filament_settings_id",
+    ProfileType.MACHINE: "printer_settings_id",
+    ProfileType.PRINT: "print_settings_id",
+}
+
+# Longer strings (G-code blocks, notes) are rarely repeated verbatim.
+_INTERN_MAX_LEN = 256
+
+
+def _intern_strings(value: Any) -> Any:
+    """Return ``value`` with its dict keys and short strings interned.
+
+    Profiles of one vendor repeat the same keys and small values ("0.2",
+    "1", material names) thousands of times; interning keeps one copy of
+    each while a whole version's profiles are held in memory.
+    """
+    if isinstance(value, str):
+        return sys.intern(value) if len(value) < _INTERN_MAX_LEN else value
+    if isinstance(value, dict):
+        return {
+            sys.intern(key) if isinstance(key, str) else key: _intern_strings(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [_intern_strings(item) for item in value]
+    return value
+
+
+def _reintern_settings(result: ParsedProfile | str) -> ParsedProfile | str:
+    """Re-intern a worker's parsed settings; unpickled strings are fresh copies."""
+    if not isinstance(result, str):
+        result.settings = _intern_strings(result.settings)
+    return result
+
+
+def _find_by_suffix(directory: Path, suffixes: Sequence[str]) -> dict[str, list[Path]]:
+    """Collect files below ``directory`` whose names end with each suffix.
+
+    Like a sorted ``directory.rglob(f"*{suffix}")`` per suffix, but walks the
+    tree once with fileio.iter_files; symlinked directories are not entered.
+    """
+    found: dict[str, list[Path]] = {suffix: [] for suffix in suffixes}
+    for entry in iter_files(directory):
+        for suffix in suffixes:
+            if entry.name.endswith(suffix):
+                found[suffix].append(Path(entry.path))
+    for paths in found.values():
+        paths.sort()
+    return found
+
+
+def _parse_or_error(parser: "BaseParser", path: Path) -> ParsedProfile | str:
+    """Parse one file, returning the error message instead of raising.
+
+    Runs in worker processes, so failures come back as plain strings that
+    the parent logs in file order.
+    """
+    try:
+        return parser.parse_file(path)
+    except (KeyError, OSError, TypeError, ValueError) as exc:
+        return str(exc)
+
 
 class BaseParser(ABC):
     @property
@@ -30,21 +103,43 @@ class BaseParser(ABC):
             resource_version: Version of the source snapshot being parsed. Parsers
                 that expose native composition metadata can retain this value.
         """
-        for vendor_dir in sorted(directory.iterdir()):
-            if not vendor_dir.is_dir():
+        with os.scandir(directory) as entries:
+            vendor_dirs = sorted(
+                (Path(entry.path) for entry in entries if entry.is_dir()),
+                key=lambda path: path.name,
+            )
+        paths = [
+            path
+            for vendor_dir in vendor_dirs
+            for path in self._glob_profiles(vendor_dir)
+        ]
+        workers = os.cpu_count() or 1
+        if workers > 1 and len(paths) >= _PARALLEL_MIN_FILES:
+            # parse_file is pure and CPU-bound, so large trees are spread
+            # across processes; map() keeps results in file order.
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = pool.map(
+                    _parse_or_error, itertools.repeat(self), paths, chunksize=64
+                )
+                results = map(_reintern_settings, results)
+                yield from self._filter_parsed(paths, results, profile_type_filter)
+        else:
+            results = map(_parse_or_error, itertools.repeat(self), paths)
+            yield from self._filter_parsed(paths, results, profile_type_filter)
+
+    @staticmethod
+    def _filter_parsed(
+        paths: list[Path],
+        results: Iterator[ParsedProfile | str],
+        profile_type_filter: list[ProfileType] | None,
+    ) -> Iterator[ParsedProfile]:
+        for path, result in zip(paths, results):
+            if isinstance(result, str):
+                logger.warning("Skipping invalid profile %s: %s", path, result)
+                continue
+            if profile_type_filter and result.profile_type not in profile_type_filter:
                 continue
-            for path in self._glob_profiles(vendor_dir):
-                try:
-                    profile = self.parse_file(path)
-                    if (
-                        profile_type_filter
-                        and profile.profile_type not in profile_type_filter
-                    ):
-                        continue
-                    yield profile
-                except (KeyError, OSError, TypeError, ValueError) as exc:
-                    logger.warning("Skipping invalid profile %s: %s", path, exc)
-                    continue
+            yield result
 
     @abstractmethod
     def _glob_profiles(self, vendor_dir: Path) -> Iterator[Path]:
@@ -34,7 +34,7 @@ from pathlib import Path
 from typing import Any, ClassVar
 
 from ..models import ParsedProfile, ProfileType, SlicerType
-from .base import BaseParser
+from .base import BaseParser, _find_by_suffix
 
 logger = logging.getLogger(__name__)
 
@@ -671,7 +671,7 @@ class _DefinitionGraph:
         self._cache: dict[str, _ResolvedDefinition] = {}
         for path in sorted(paths):
             try:
-                data = json.loads(path.read_text(encoding="utf-8"))
+                data = json.loads(path.read_bytes())
             except (OSError, json.JSONDecodeError) as exc:
                 logger.warning("Skipping invalid Cura definition %s: %s", path, exc)
                 continue
@@ -830,14 +830,19 @@ def _build_overlay_recompute_plan(
         expressions[key] = expression
         dependencies[key] = _expression_dependencies(expression, schema_keys)
 
+    # Walk reverse edges from the triggers once instead of re-scanning every
+    # expression until the affected set stops growing.
+    dependents: dict[str, list[str]] = {}
+    for key, setting_dependencies in dependencies.items():
+        for dependency in setting_dependencies:
+            dependents.setdefault(dependency, []).append(key)
     affected = set(trigger_keys) & schema_keys
-    changed = True
-    while changed:
-        changed = False
-        for key, setting_dependencies in dependencies.items():
-            if key not in affected and setting_dependencies.intersection(affected):
+    pending = list(affected)
+    while pending:
+        for key in dependents.get(pending.pop(), ()):
+            if key not in affected:
                 affected.add(key)
-                changed = True
+                pending.append(key)
 
     return {
         key: {
@@ -1093,14 +1098,19 @@ def _parse_instance(path: Path, source_kind: str) -> _InstanceResource:
     )
 
 
+@functools.lru_cache(maxsize=1024)
+def _split_tag(tag: str) -> tuple[str, str]:
+    """Return ``(namespace, local name)`` for a ``{namespace}name`` tag."""
+    namespace = tag[1:].split("}", 1)[0] if tag.startswith("{") else ""
+    return namespace, tag.rsplit("}", 1)[-1]
+
+
 def _local_name(element: ET.Element) -> str:
-    return element.tag.rsplit("}", 1)[-1]
+    return _split_tag(element.tag)[1]
 
 
 def _namespace(element: ET.Element) -> str:
-    if element.tag.startswith("{"):
-        return element.tag[1:].split("}", 1)[0]
-    return ""
+    return _split_tag(element.tag)[0]
 
 
 def _material_setting_key(element: ET.Element) -> str | None:
@@ -1118,14 +1128,17 @@ def _material_setting_key(element: ET.Element) -> str | None:
     return None
 
 
-def _child(element: ET.Element | None, name: str) -> ET.Element | None:
-    if element is None:
-        return None
-    return next((item for item in element if _local_name(item) == name), None)
+def _children(element: ET.Element | None) -> dict[str, ET.Element]:
+    """Map each child local name to the first child element carrying it."""
+    children: dict[str, ET.Element] = {}
+    if element is not None:
+        for item in element:
+            children.setdefault(_local_name(item), item)
+    return children
 
 
-def _child_text(element: ET.Element | None, name: str) -> str:
-    item = _child(element, name)
+def _child_text(children: Mapping[str, ET.Element], name: str) -> str:
+    item = children.get(name)
     return (item.text or "").strip() if item is not None else ""
 
 
@@ -1179,8 +1192,10 @@ class CuraParser(BaseParser):
         profile_type_filter: list[ProfileType] | None = None,
         resource_version: str | None = None,
     ) -> Iterator[ParsedProfile]:
-        definition_paths = sorted(directory.rglob("*.def.json"))
-        graph = _DefinitionGraph(definition_paths)
+        resource_paths = _find_by_suffix(
+            directory, (".def.json", ".inst.cfg", ".fdm_material")
+        )
+        graph = _DefinitionGraph(resource_paths[".def.json"])
         base_schema = (
             graph.resolve("fdmprinter").schema if "fdmprinter" in graph else {}
         )
@@ -1191,7 +1206,7 @@ class CuraParser(BaseParser):
             )
 
         instances: list[_InstanceResource] = []
-        for path in sorted(directory.rglob("*.inst.cfg")):
+        for path in resource_paths[".inst.cfg"]:
             kind = self._source_kind(path)
             try:
                 instances.append(_parse_instance(path, kind))
@@ -1207,7 +1222,7 @@ class CuraParser(BaseParser):
         profiles: list[ParsedProfile] = []
 
         material_profiles: list[ParsedProfile] = []
-        for path in sorted(directory.rglob("*.fdm_material")):
+        for path in resource_paths[".fdm_material"]:
             try:
                 material_profiles.append(
                     self._parse_fdm_material(
@@ -1852,9 +1867,9 @@ class CuraParser(BaseParser):
         schema: Mapping[str, Mapping[str, Any]],
         resource_version: str | None = None,
     ) -> ParsedProfile:
-        root = ET.parse(path).getroot()
-        metadata = _child(root, "metadata")
-        name_element = _child(metadata, "name")
+        sections = _children(ET.fromstring(path.read_bytes()))
+        metadata = _children(sections.get("metadata"))
+        name_element = _children(metadata.get("name"))
         brand = _child_text(name_element, "brand")
         material_type = _child_text(name_element, "material")
         color = _child_text(name_element, "color")
@@ -1868,38 +1883,36 @@ class CuraParser(BaseParser):
             "material_type": material_type,
             "material_brand": brand,
         }
-        properties = _child(root, "properties")
-        diameter = _child_text(properties, "diameter")
+        diameter = _child_text(_children(sections.get("properties")), "diameter")
         if diameter:
             raw_settings["material_diameter"] = diameter
 
-        settings_element = _child(root, "settings")
+        settings_element = sections.get("settings")
         machine_overrides: list[dict[str, Any]] = []
         default_compatible = True
         if settings_element is not None:
-            # Machine blocks inherit the material-wide value regardless of
-            # their XML order, so resolve it before parsing any block.
-            for setting in settings_element:
-                if (
-                    _local_name(setting) == "setting"
-                    and setting.get("key") == "hardware compatible"
-                ):
-                    default_compatible = _parse_compatible_value(setting.text)
-                    break
+            machine_elements: list[ET.Element] = []
+            compatible_setting: ET.Element | None = None
             for setting in settings_element:
                 local_name = _local_name(setting)
                 if local_name == "setting":
                     if setting.get("key") == "hardware compatible":
+                        if compatible_setting is None:
+                            compatible_setting = setting
                         continue
                     mapped_key = _material_setting_key(setting)
                     if mapped_key:
                         raw_settings[mapped_key] = (setting.text or "").strip()
                 elif local_name == "machine":
-                    machine_overrides.append(
-                        self._parse_material_machine(
-                            setting, schema, default_compatible
-                        )
-                    )
+                    machine_elements.append(setting)
+            # Machine blocks inherit the material-wide value regardless of
+            # their XML order, so parse them once the whole block is read.
+            if compatible_setting is not None:
+                default_compatible = _parse_compatible_value(compatible_setting.text)
+            machine_overrides = [
+                self._parse_material_machine(element, schema, default_compatible)
+                for element in machine_elements
+            ]
 
         compatibility = {
             "default": default_compatible,
@@ -2026,7 +2039,7 @@ class CuraParser(BaseParser):
     def _parse_definition_file(
         self, path: Path, resource_version: str | None = None
     ) -> ParsedProfile:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = json.loads(path.read_bytes())
         native_id = _resource_id(path)
         metadata = data.get("metadata", {})
         schema = _definition_schema(data)
@@ -2291,9 +2304,10 @@ class CuraParser(BaseParser):
         return target in resolved.inheritance
 
     def _glob_profiles(self, vendor_dir: Path) -> Iterator[Path]:
-        yield from sorted(vendor_dir.rglob("*.fdm_material"))
-        yield from sorted(vendor_dir.rglob("*.def.json"))
-        yield from sorted(vendor_dir.rglob("*.inst.cfg"))
+        suffixes = (".fdm_material", ".def.json", ".inst.cfg")
+        resource_paths = _find_by_suffix(vendor_dir, suffixes)
+        for suffix in suffixes:
+            yield from resource_paths[suffix]
 
     @staticmethod
     def _disambiguate_profile_names(profiles: list[ParsedProfile]) -> None:
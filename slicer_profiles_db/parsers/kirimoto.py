@@ -9,7 +9,7 @@ from pathlib import Path
 from typing import Any
 
 from ..models import ParsedProfile, ProfileType, SlicerType
-from .base import BaseParser
+from .base import BaseParser, _find_by_suffix
 
 _FILAMENT_TYPES = (
     "TPU-AMS",
@@ -169,7 +169,7 @@ class KiriMotoParser(BaseParser):
 
     def parse_file(self, path: Path) -> ParsedProfile:
         """Return the concrete machine role for one device file."""
-        source = json.loads(path.read_text(encoding="utf-8"))
+        source = json.loads(path.read_bytes())
         vendor, _model, display_name = _split_identity(path)
         device = _normalize_device(source, f"{display_name} 0.4 nozzle")
         nozzle = device["extruders"][0]["extNozzle"]
@@ -200,9 +200,9 @@ class KiriMotoParser(BaseParser):
         resource_version: str | None = None,
     ) -> Iterator[ParsedProfile]:
         requested = set(profile_type_filter or ProfileType)
-        for path in sorted(directory.rglob("*.json")):
+        for path in _find_by_suffix(directory, (".json",))[".json"]:
             try:
-                source = json.loads(path.read_text(encoding="utf-8"))
+                source = json.loads(path.read_bytes())
                 machine = self.parse_file(path)
             except (json.JSONDecodeError, KeyError, TypeError, ValueError):
                 continue
@@ -315,4 +315,4 @@ class KiriMotoParser(BaseParser):
                     )
 
     def _glob_profiles(self, vendor_dir: Path) -> Iterator[Path]:
-        yield from sorted(vendor_dir.rglob("*.json"))
+        yield from _find_by_suffix(vendor_dir, (".json",))[".json"]
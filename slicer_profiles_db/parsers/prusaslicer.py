@@ -3,7 +3,7 @@ from collections.abc import Iterator
 from pathlib import Path
 
 from ..models import ParsedProfile, ProfileType, SlicerType
-from .base import BaseParser
+from .base import _SETTINGS_ID_KEYS, BaseParser, _find_by_suffix, _intern_strings
 
 
 class PrusaSlicerParser(BaseParser):
@@ -18,7 +18,16 @@ class PrusaSlicerParser(BaseParser):
     slicer_type = SlicerType.PRUSASLICER
 
     def parse_file(self, path: Path) -> ParsedProfile:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        return self.parse_data(json.loads(path.read_bytes()), path)
+
+    def parse_data(self, data: dict, path: Path) -> ParsedProfile:
+        """Build a profile from already-decoded data.
+
+        ``path`` need not exist; it only supplies the vendor (its parent
+        directory name), the name fallback and ``source_path``, exactly as
+        for a file at that location.
+        """
+        data = _intern_strings(data)
         vendor = path.parent.name
 
         # Determine profile type from data content
@@ -48,28 +57,27 @@ class PrusaSlicerParser(BaseParser):
         if "variants" in data:
             return ProfileType.MACHINE_MODEL
 
+        # filament: has filament_settings_id, whatever other ids it carries
+        if "filament_settings_id" in data:
+            return ProfileType.FILAMENT
+
         # machine: has printer_settings_id but no variants
-        if "printer_settings_id" in data and "filament_settings_id" not in data:
+        if "printer_settings_id" in data:
             return ProfileType.MACHINE
 
         # print: has print_settings_id
-        if "print_settings_id" in data and "filament_settings_id" not in data:
+        if "print_settings_id" in data:
             return ProfileType.PRINT
 
-        # filament: has filament_settings_id or filament_type, or default
+        # filament: default
         return ProfileType.FILAMENT
 
     def _extract_name(self, data: dict, profile_type: ProfileType, path: Path) -> str:
         """Extract the profile name based on type."""
-        if profile_type == ProfileType.FILAMENT:
-            return data.get("filament_settings_id", data.get("name", path.stem))
-        elif profile_type == ProfileType.MACHINE:
-            return data.get("printer_settings_id", data.get("name", path.stem))
-        elif profile_type == ProfileType.MACHINE_MODEL:
-            return data.get("name", path.stem)
-        elif profile_type == ProfileType.PRINT:
-            return data.get("print_settings_id", data.get("name", path.stem))
-        return path.stem
+        id_key = _SETTINGS_ID_KEYS.get(profile_type)
+        if id_key in data:
+            return data[id_key]
+        return data.get("name", path.stem)
 
     def _glob_profiles(self, vendor_dir: Path) -> Iterator[Path]:
-        yield from sorted(vendor_dir.rglob("*.json"))
+        yield from _find_by_suffix(vendor_dir, (".json",))[".json"]
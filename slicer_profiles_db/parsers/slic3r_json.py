@@ -4,7 +4,7 @@ from pathlib import Path
 from typing import Any
 
 from ..models import ParsedProfile, ProfileType
-from .base import BaseParser
+from .base import _SETTINGS_ID_KEYS, BaseParser, _find_by_suffix, _intern_strings
 
 
 def _first(value: Any) -> str | None:
@@ -17,44 +17,46 @@ def _first(value: Any) -> str | None:
 # Profile type subdirectory names used by BBS/Orca.
 # Note: machine_model profiles also live in the "machine/" directory
 # alongside regular machine profiles, distinguished by "type": "machine_model".
-_TYPE_DIR_NAMES = {"filament", "machine", "process"}
+_TYPE_DIR_NAMES = frozenset({"filament", "machine", "process"})
+
+# Raw "type" values to our unified ProfileType; "process" is our "print".
+_PROFILE_TYPES: dict[str, ProfileType] = {
+    **{profile_type.value: profile_type for profile_type in ProfileType},
+    "process": ProfileType.PRINT,
+}
 
 
 class Slic3rJsonParser(BaseParser):
     """Shared parser for BambuStudio and OrcaSlicer JSON profiles."""
 
     def parse_file(self, path: Path) -> ParsedProfile:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = _intern_strings(json.loads(path.read_bytes()))
 
         raw_type = data.get("type", "filament")
-        # Map "process" to "print" for our unified ProfileType
-        if raw_type == "process":
-            profile_type = ProfileType.PRINT
-        else:
+        try:
+            profile_type = _PROFILE_TYPES[raw_type]
+        except (KeyError, TypeError):
+            # Unknown types fail with the usual enum error
             profile_type = ProfileType(raw_type)
 
         # Name extraction with fallbacks per type
         name = data.get("name")
         if not name:
-            if profile_type == ProfileType.FILAMENT:
-                name = data.get("filament_settings_id", path.stem)
-            elif profile_type == ProfileType.MACHINE:
-                name = data.get("printer_settings_id", path.stem)
-            elif profile_type == ProfileType.PRINT:
-                name = data.get("print_settings_id", path.stem)
-            else:
-                name = path.stem
+            id_key = _SETTINGS_ID_KEYS.get(profile_type)
+            name = data.get(id_key, path.stem) if id_key else path.stem
 
         # Vendor detection: walk up from the file to find the vendor directory.
         # Profiles live in structures like:
         #   {vendor}/{type}/file.json           → vendor = {vendor}
         #   {vendor}/{type}/{subdir}/file.json  → vendor = {vendor}
         #   {vendor}/file.json                  → vendor = {vendor}
-        # We find the type dir in the path and take its parent as vendor.
+        # We find the type dir in the path and take its parent as vendor,
+        # scanning the path's string parts rather than building each parent.
+        parts = path.parts[1:] if path.anchor else path.parts
         vendor = path.parent.name
-        for parent in path.parents:
-            if parent.name in _TYPE_DIR_NAMES:
-                vendor = parent.parent.name
+        for i in range(len(parts) - 2, -1, -1):
+            if parts[i] in _TYPE_DIR_NAMES:
+                vendor = parts[i - 1] if i else ""
                 break
 
         return ParsedProfile(
@@ -70,4 +72,4 @@ class Slic3rJsonParser(BaseParser):
         )
 
     def _glob_profiles(self, vendor_dir: Path) -> Iterator[Path]:
-        yield from sorted(vendor_dir.rglob("*.json"))
+        yield from _find_by_suffix(vendor_dir, (".json",))[".json"]
@@ -4,32 +4,27 @@ Pipeline orchestrator: download → squash → parse → store.
 High-level interface that chains all the slicer profile processing steps.
 """
 
+import json
 import logging
 import shutil
 import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
 
+from . import parsers
 from .download import (
+    BRANCH_NAMES,
     apply_overlays,
     download_and_extract,
     get_source_config,
+    iter_overlay_files,
 )
 from .models import (
     IngestionReport,
+    ParsedProfile,
     ProfileType,
     SlicerType,
-)
-from .parsers import (
-    AnycubicSlicerParser,
-    BambuStudioParser,
-    CrealityPrintParser,
-    CuraParser,
-    ElegooSlicerParser,
-    KiriMotoParser,
-    OrcaSlicerParser,
-    PrusaSlicerParser,
-    SuperSlicerParser,
+    SourceConfig,
 )
 from .parsers.base import BaseParser
 from .progress import NullProgressReporter, ProgressReporter
@@ -37,11 +32,12 @@ from .resources import (
     ResourceStore,
     collect_referenced_hashes,
     collect_resources,
+    iter_rewritten_resource_refs,
     rewrite_resource_refs,
 )
 from .squash import (
     iter_ini_bundle_versions,
-    split_prusaslicer_bundle,
+    iter_prusaslicer_bundle,
     squash_all_slic3r_vendors,
     unpack_prusaslicer_bundles,
 )
@@ -56,6 +52,20 @@ from .versions import (
 
 logger = logging.getLogger(__name__)
 
+# Parser class per slicer, resolved through the lazy ``parsers`` package so
+# only the modules for slicers actually ingested get imported.
+_PARSER_NAMES = {
+    SlicerType.BAMBUSTUDIO: "BambuStudioParser",
+    SlicerType.ORCASLICER: "OrcaSlicerParser",
+    SlicerType.CREALITYPRINT: "CrealityPrintParser",
+    SlicerType.PRUSASLICER: "PrusaSlicerParser",
+    SlicerType.CURA: "CuraParser",
+    SlicerType.ELEGOOSLICER: "ElegooSlicerParser",
+    SlicerType.ANYCUBICSLICER: "AnycubicSlicerParser",
+    SlicerType.SUPERSLICER: "SuperSlicerParser",
+    SlicerType.KIRIMOTO: "KiriMotoParser",
+}
+
 
 class DownloadError(Exception):
     """Raised when downloading slicer profiles from GitHub fails."""
@@ -95,17 +105,15 @@ class ProfilePipeline:
         self.overlay_dir = overlay_dir
         self.work_dir = work_dir
         self.reporter: ProgressReporter = reporter or NullProgressReporter()
-        self._parsers: dict[SlicerType, BaseParser] = {
-            SlicerType.BAMBUSTUDIO: BambuStudioParser(),
-            SlicerType.ORCASLICER: OrcaSlicerParser(),
-            SlicerType.CREALITYPRINT: CrealityPrintParser(),
-            SlicerType.PRUSASLICER: PrusaSlicerParser(),
-            SlicerType.CURA: CuraParser(),
-            SlicerType.ELEGOOSLICER: ElegooSlicerParser(),
-            SlicerType.ANYCUBICSLICER: AnycubicSlicerParser(),
-            SlicerType.SUPERSLICER: SuperSlicerParser(),
-            SlicerType.KIRIMOTO: KiriMotoParser(),
-        }
+        self._parsers: dict[SlicerType, BaseParser] = {}
+
+    def _get_parser(self, slicer: SlicerType) -> BaseParser:
+        """Return the parser for ``slicer``, importing its module on first use."""
+        parser = self._parsers.get(slicer)
+        if parser is None:
+            parser = getattr(parsers, _PARSER_NAMES[slicer])()
+            self._parsers[slicer] = parser
+        return parser
 
     def ingest(
         self,
@@ -113,6 +121,11 @@ class ProfilePipeline:
         version: str = "latest",
         profile_types: list[ProfileType] | None = None,
         force: bool = False,
+        existing_versions: set[str] | None = None,
+        config: SourceConfig | None = None,
+        collect_garbage: bool = True,
+        work_dir: Path | None = None,
+        disposable_work_dir: bool = False,
     ) -> IngestionReport:
         """
         Full pipeline: download → extract → squash → parse → store.
@@ -121,11 +134,23 @@ class ProfilePipeline:
             slicer: Which slicer to process.
             version: Version tag string, or "latest" to use the most recent tag.
             profile_types: If set, only process these profile types.
+            existing_versions: Versions already in the store, when the caller
+                has them at hand; read from the store otherwise.
+            config: Source configuration for ``slicer``, when the caller
+                already resolved it.
+            collect_garbage: Remove resources no stored profile references
+                afterwards.  Batch callers disable this and collect once.
+            work_dir: Scratch directory to use instead of ``self.work_dir``
+                or a fresh temporary one; left in place afterwards.
+            disposable_work_dir: ``work_dir`` is a temporary directory the
+                caller deletes, so extracted resources may be hardlinked into
+                the resource store instead of copied.
 
         Returns:
             IngestionReport with details of what was added/changed/removed.
         """
-        config = get_source_config(slicer)
+        if config is None:
+            config = get_source_config(slicer)
 
         # Resolve special version keywords
         is_nightly = version == "nightly"
@@ -133,16 +158,17 @@ class ProfilePipeline:
             self.reporter.update_status(
                 f"Resolving latest version for {slicer.value}..."
             )
-            version = self._resolve_latest_version(slicer)
+            version = self._resolve_latest_version(slicer, config)
         elif is_nightly:
-            version = self._resolve_nightly_version(slicer)
+            version = self._resolve_nightly_version(config)
 
         # Skip immutable versions that are already in the store.
         # Mutable versions (branches, nightly) are always re-processed.
         if not force and not self._is_version_mutable(version):
             normalized = normalize_version(version)
-            existing = self.store.get_versions(slicer)
-            if normalized in existing:
+            if existing_versions is None:
+                existing_versions = set(self.store.get_versions(slicer))
+            if normalized in existing_versions:
                 self.reporter.update_status(
                     f"Skipping {slicer.value} {normalized} (already ingested)"
                 )
@@ -155,8 +181,11 @@ class ProfilePipeline:
 
         # Create temp working directory
         created_temp = False
-        if self.work_dir:
-            work = self.work_dir
+        if work_dir is None:
+            disposable_work_dir = False
+            work_dir = self.work_dir
+        if work_dir:
+            work = work_dir
             work.mkdir(parents=True, exist_ok=True)
         else:
             work = Path(tempfile.mkdtemp(prefix=f"ofd-slicer-{slicer.value}-"))
@@ -164,7 +193,14 @@ class ProfilePipeline:
 
         try:
             return self._run_pipeline(
-                slicer, config, version, work, profile_types, is_nightly
+                slicer,
+                config,
+                version,
+                work,
+                profile_types,
+                is_nightly,
+                collect_garbage,
+                link_resources=created_temp or disposable_work_dir,
             )
         finally:
             if created_temp and work.exists():
@@ -178,8 +214,14 @@ class ProfilePipeline:
         work: Path,
         profile_types: list[ProfileType] | None,
         is_nightly: bool,
+        collect_garbage: bool = True,
+        link_resources: bool = False,
     ) -> IngestionReport:
-        """Execute the pipeline steps (separated for clean temp dir cleanup)."""
+        """Execute the pipeline steps (separated for clean temp dir cleanup).
+
+        ``link_resources`` hardlinks resources into the store; only pass it
+        when ``work`` is a scratch directory that is deleted afterwards.
+        """
 
         # Step 1: Download and extract
         self.reporter.update_status(f"Downloading {slicer.value} {version}...")
@@ -192,7 +234,7 @@ class ProfilePipeline:
         # Must happen BEFORE squash — squash_slic3r_profiles does rmtree on
         # each vendor dir, which destroys resource files alongside the JSONs.
         resource_store = ResourceStore(self.store.root / slicer.value / "_resources")
-        resource_map = collect_resources(extracted, resource_store)
+        resource_map = collect_resources(extracted, resource_store, link=link_resources)
 
         # Step 3: Squash inheritance
         detected_version: str | None = None
@@ -225,30 +267,26 @@ class ProfilePipeline:
         if is_nightly:
             normalized_version = f"nightly-{normalized_version}"
 
-        # Step 6: Parse
-        self.reporter.update_status(f"Parsing {slicer.value} profiles...")
-        parser = self._parsers[slicer]
-        parsed = list(
-            parser.parse_directory(
-                extracted,
-                profile_type_filter=profile_types,
-                resource_version=normalized_version,
-            )
-        )
-
-        # Step 7: Rewrite resource references in parsed profiles
-        if resource_map:
-            rewrite_resource_refs(parsed, resource_map)
-
-        # Step 8: Store
+        # Steps 6-8: Parse, rewrite resource references and store.  Profiles
+        # stream from the parser into the store instead of being collected
+        # into an intermediate list first.
         self.reporter.update_status(
-            f"Storing {len(parsed)} {slicer.value} profiles (version {normalized_version})..."
+            f"Parsing and storing {slicer.value} profiles "
+            f"(version {normalized_version})..."
+        )
+        parser = self._get_parser(slicer)
+        parsed = parser.parse_directory(
+            extracted,
+            profile_type_filter=profile_types,
+            resource_version=normalized_version,
         )
+        if resource_map:
+            parsed = iter_rewritten_resource_refs(parsed, resource_map)
         report = self.store.ingest_profiles(slicer, normalized_version, parsed)
 
         # Step 9: Garbage-collect orphaned resources
-        referenced = collect_referenced_hashes(self.store.root, slicer.value)
-        resource_store.gc(referenced)
+        if collect_garbage:
+            self._collect_resource_garbage(slicer, resource_store)
 
         return report
 
@@ -256,6 +294,7 @@ class ProfilePipeline:
         self,
         slicer: SlicerType,
         profile_types: list[ProfileType] | None = None,
+        config: SourceConfig | None = None,
     ) -> list[IngestionReport]:
         """
         Download an INI-bundle repo once and ingest all vendor-version combinations.
@@ -267,11 +306,14 @@ class ProfilePipeline:
         Args:
             slicer: Which slicer to process.
             profile_types: If set, only process these profile types.
+            config: Source configuration for ``slicer``, when the caller
+                already resolved it.
 
         Returns:
             List of IngestionReport, one per version.
         """
-        config = get_source_config(slicer)
+        if config is None:
+            config = get_source_config(slicer)
 
         # Create temp working directory
         created_temp = False
@@ -310,38 +352,25 @@ class ProfilePipeline:
             resource_store = ResourceStore(
                 self.store.root / slicer.value / "_resources"
             )
-            resource_map = collect_resources(extracted, resource_store)
+            # Hardlink only out of a temporary directory; a caller's
+            # work_dir is kept and its files could be edited later.
+            resource_map = collect_resources(
+                extracted, resource_store, link=created_temp
+            )
 
             # Step 4: Process each version oldest-to-newest
-            parser = self._parsers[slicer]
+            parser = self._get_parser(slicer)
+            if not isinstance(parser, parsers.PrusaSlicerParser):
+                raise TypeError(f"{slicer.value} profiles are not INI bundles")
             reports: list[IngestionReport] = []
 
             for i, (ver, vendor_inis) in enumerate(version_groups, 1):
                 self.reporter.step(f"{slicer.value} {ver}", i, len(version_groups))
 
-                # Create a temp split directory for this version
-                split_dir = work / f"_split_{ver}"
-                split_dir.mkdir(parents=True, exist_ok=True)
-
                 try:
-                    # Split each vendor's INI bundle
-                    for vendor_name, ini_path in vendor_inis:
-                        vendor_out = split_dir / vendor_name
-                        vendor_out.mkdir(parents=True, exist_ok=True)
-                        split_prusaslicer_bundle(ini_path, vendor_out)
-
-                    # Apply overlays after split (overlay profiles should
-                    # be complete/pre-squashed)
-                    if self.overlay_dir:
-                        apply_overlays(split_dir, self.overlay_dir, slicer)
-
-                    # Parse the split directory
-                    parsed = list(
-                        parser.parse_directory(
-                            split_dir,
-                            profile_type_filter=profile_types,
-                            resource_version=ver,
-                        )
+                    # Split, overlay and parse this version's bundles
+                    parsed = self._parse_ini_version(
+                        parser, slicer, work / "_split", vendor_inis, profile_types
                     )
 
                     # Rewrite resource references
@@ -362,14 +391,9 @@ class ProfilePipeline:
                         "Failed to ingest %s %s", slicer.value, ver, exc_info=True
                     )
                     continue
-                finally:
-                    # Clean up split dir
-                    if split_dir.exists():
-                        shutil.rmtree(split_dir, ignore_errors=True)
 
             # Garbage-collect orphaned resources
-            referenced = collect_referenced_hashes(self.store.root, slicer.value)
-            resource_store.gc(referenced)
+            self._collect_resource_garbage(slicer, resource_store)
 
             return reports
 
@@ -377,6 +401,54 @@ class ProfilePipeline:
             if created_temp and work.exists():
                 shutil.rmtree(work, ignore_errors=True)
 
+    def _parse_ini_version(
+        self,
+        parser: "parsers.PrusaSlicerParser",
+        slicer: SlicerType,
+        split_dir: Path,
+        vendor_inis: list[tuple[str, Path]],
+        profile_types: list[ProfileType] | None,
+    ) -> list[ParsedProfile]:
+        """Parse one version's INI bundles without writing split files.
+
+        Each squashed section is keyed by the path split_prusaslicer_bundle
+        would give it under ``split_dir``, and overlay files by the path
+        apply_overlays would copy them to.  Parsing those paths in sorted
+        order reproduces parse_directory over the split directory, without
+        the JSON write and re-read per section.
+        """
+        documents: dict[Path, dict | None] = {}
+        for vendor_name, ini_path in vendor_inis:
+            vendor_out = split_dir / vendor_name
+            for file_name, data in iter_prusaslicer_bundle(ini_path):
+                documents[vendor_out / file_name] = data
+
+        # Overlay profiles should be complete/pre-squashed
+        if self.overlay_dir:
+            for overlay_file, rel in iter_overlay_files(self.overlay_dir, slicer):
+                if not rel.name.endswith(".json"):
+                    continue
+                try:
+                    documents[split_dir / rel] = json.loads(overlay_file.read_bytes())
+                except (OSError, ValueError) as exc:
+                    logger.warning("Skipping invalid profile %s: %s", overlay_file, exc)
+                    documents[split_dir / rel] = None
+
+        parsed: list[ParsedProfile] = []
+        for path in sorted(documents):
+            data = documents[path]
+            if data is None:
+                continue
+            try:
+                profile = parser.parse_data(data, path)
+            except (KeyError, TypeError, ValueError) as exc:
+                logger.warning("Skipping invalid profile %s: %s", path, exc)
+                continue
+            if profile_types and profile.profile_type not in profile_types:
+                continue
+            parsed.append(profile)
+        return parsed
+
     def ingest_all_versions(
         self,
         slicer: SlicerType,
@@ -400,11 +472,11 @@ class ProfilePipeline:
 
         # INI-bundle slicers: download once, process all versions from the bundle
         if config.ini_bundle:
-            return self.ingest_all_ini_versions(slicer, profile_types)
+            return self.ingest_all_ini_versions(slicer, profile_types, config=config)
 
         # Branch-only slicers without tag enumeration (e.g. Cura): just ingest HEAD
         if config.branch and not config.tag_pattern:
-            report = self.ingest(slicer, "latest", profile_types)
+            report = self.ingest(slicer, "latest", profile_types, config=config)
             return [report]
 
         # Tag-based slicers: enumerate tags and ingest each
@@ -432,24 +504,62 @@ class ProfilePipeline:
                 f"Skipping {skipped} already-ingested versions for {slicer.value}"
             )
 
+        # Share one scratch directory across the batch; download_and_extract
+        # clears the previous tag's tree before extracting the next one.
+        created_temp = False
+        if self.work_dir:
+            work = self.work_dir
+        else:
+            work = Path(tempfile.mkdtemp(prefix=f"ofd-slicer-{slicer.value}-batch-"))
+            created_temp = True
+
         reports = []
-        for i, norm_ver in enumerate(new_versions, 1):
-            tag = tag_map[norm_ver]
-            self.reporter.step(f"{slicer.value} {tag.raw}", i, len(new_versions))
-            try:
-                report = self.ingest(slicer, tag.raw, profile_types)
-                reports.append(report)
-            except Exception as e:
-                self.reporter.update_status(
-                    f"Failed to ingest {slicer.value} {tag.raw}: {e}"
-                )
-                logger.warning(
-                    "Failed to ingest %s %s", slicer.value, tag.raw, exc_info=True
-                )
-                continue
+        try:
+            for i, norm_ver in enumerate(new_versions, 1):
+                tag = tag_map[norm_ver]
+                self.reporter.step(f"{slicer.value} {tag.raw}", i, len(new_versions))
+                try:
+                    report = self.ingest(
+                        slicer,
+                        tag.raw,
+                        profile_types,
+                        existing_versions=existing_versions,
+                        config=config,
+                        collect_garbage=False,
+                        work_dir=work,
+                        disposable_work_dir=created_temp,
+                    )
+                    reports.append(report)
+                except Exception as e:
+                    self.reporter.update_status(
+                        f"Failed to ingest {slicer.value} {tag.raw}: {e}"
+                    )
+                    logger.warning(
+                        "Failed to ingest %s %s", slicer.value, tag.raw, exc_info=True
+                    )
+                    continue
+        finally:
+            if created_temp and work.exists():
+                shutil.rmtree(work, ignore_errors=True)
+
+        # Every stored profile is scanned for resource references, so do it
+        # once for the batch rather than after each version.
+        if new_versions:
+            self._collect_resource_garbage(slicer)
 
         return reports
 
+    def _collect_resource_garbage(
+        self, slicer: SlicerType, resource_store: ResourceStore | None = None
+    ) -> None:
+        """Remove stored resources that no stored profile references."""
+        if resource_store is None:
+            resource_store = ResourceStore(
+                self.store.root / slicer.value / "_resources"
+            )
+        referenced = collect_referenced_hashes(self.store.root, slicer.value)
+        resource_store.gc(referenced)
+
     @staticmethod
     def _is_version_mutable(version: str) -> bool:
         """Return True if this version should always be re-processed.
@@ -459,11 +569,11 @@ class ProfilePipeline:
         they've been ingested.
         """
         normalized = normalize_version(version)
-        if normalized in ("main", "master", "develop", "dev"):
+        if normalized in BRANCH_NAMES:
             return True
         return normalized.startswith("nightly")
 
-    def _resolve_latest_version(self, slicer: SlicerType) -> str:
+    def _resolve_latest_version(self, slicer: SlicerType, config: SourceConfig) -> str:
         """Resolve 'latest' to the most recent stable version.
 
         For tag-based slicers, returns the highest stable tag.
@@ -471,8 +581,6 @@ class ProfilePipeline:
         from HEAD — the actual version is detected later from INI bundle
         filenames/content during the squash step.
         """
-        config = get_source_config(slicer)
-
         if config.branch and not config.tag_pattern:
             # Branch-only slicers: download HEAD, version detected during squash
             return config.branch
@@ -496,12 +604,11 @@ class ProfilePipeline:
         sorted_ver = sort_versions(list(tag_map.keys()))
         return tag_map[sorted_ver[-1]].raw
 
-    def _resolve_nightly_version(self, slicer: SlicerType) -> str:
+    def _resolve_nightly_version(self, config: SourceConfig) -> str:
         """Resolve 'nightly' to the branch HEAD for any slicer.
 
         Always downloads from the default branch, giving bleeding-edge profiles.
         """
-        config = get_source_config(slicer)
         if config.branch:
             return config.branch
         return config.nightly_branch
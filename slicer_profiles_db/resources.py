@@ -10,10 +10,18 @@ under /out.
 import hashlib
 import json
 import logging
+import os
+import shutil
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from .fileio import iter_files, read_files_batched, write_atomic
+
 logger = logging.getLogger(__name__)
 
+_HASH_CHUNK_SIZE = 1024 * 1024
+
 
 class ResourceStore:
     """Content-addressed store for binary resource files."""
@@ -24,14 +32,39 @@ class ResourceStore:
         self._manifest_path = self.root / "_manifest.json"
         self._manifest: dict[str, dict] = self._load_manifest()
 
-    def store(self, file_path: Path, relative_to: Path | None = None) -> str:
-        """Store a file and return its content hash (sha256 hex)."""
-        content = file_path.read_bytes()
-        hash_hex = hashlib.sha256(content).hexdigest()
+    def store(
+        self, file_path: Path, relative_to: Path | None = None, link: bool = False
+    ) -> str:
+        """Store a file and return its content hash (sha256 hex).
+
+        With ``link``, the file is hardlinked into the store when possible
+        instead of copied.  Only use it for throwaway sources (e.g. freshly
+        extracted files) that are never rewritten in place afterwards.
+        """
+        hash_hex, size = _hash_file(file_path)
+        self._add(file_path, hash_hex, size, relative_to, link)
+        return hash_hex
+
+    def _add(
+        self,
+        file_path: Path,
+        hash_hex: str,
+        size: int,
+        relative_to: Path | None,
+        link: bool = False,
+    ) -> None:
+        """Copy an already hashed file into the store and record it."""
         suffix = file_path.suffix.lower()
         dest = self.root / f"{hash_hex}{suffix}"
         if not dest.exists():
-            dest.write_bytes(content)
+            if link:
+                try:
+                    os.link(file_path, dest)
+                except OSError:
+                    # Cross-device (EXDEV) or no hardlink support
+                    shutil.copyfile(file_path, dest)
+            else:
+                shutil.copyfile(file_path, dest)
 
         source_path = file_path.name
         if relative_to is not None:
@@ -43,16 +76,15 @@ class ResourceStore:
         self._manifest[hash_hex] = {
             "filename": file_path.name,
             "source_path": source_path,
-            "size": len(content),
+            "size": size,
             "type": file_path.suffix.lstrip(".").lower(),
         }
-        return hash_hex
 
     def save_manifest(self) -> None:
-        """Write the manifest to disk."""
-        self._manifest_path.write_text(
+        """Write the manifest to disk, replacing the old one atomically."""
+        write_atomic(
+            self._manifest_path,
             json.dumps(self._manifest, indent=2, sort_keys=True, ensure_ascii=False),
-            encoding="utf-8",
         )
 
     def get_path(self, hash_hex: str) -> Path | None:
@@ -60,10 +92,13 @@ class ResourceStore:
         entry = self._manifest.get(hash_hex)
         if entry is None:
             return None
-        suffix = f".{entry['type']}" if entry.get("type") else ""
-        path = self.root / f"{hash_hex}{suffix}"
+        path = self._entry_path(hash_hex, entry)
         return path if path.exists() else None
 
+    def _entry_path(self, hash_hex: str, entry: dict) -> Path:
+        suffix = f".{entry['type']}" if entry.get("type") else ""
+        return self.root / f"{hash_hex}{suffix}"
+
     def resolve_filename(self, hash_hex: str) -> str | None:
         """Get the original filename from a hash."""
         entry = self._manifest.get(hash_hex)
@@ -95,22 +130,19 @@ class ResourceStore:
 
     def gc(self, referenced_hashes: set[str]) -> list[str]:
         """Remove resources not in referenced_hashes. Returns removed hashes."""
-        removed = []
-        for hash_hex in list(self._manifest):
-            if hash_hex not in referenced_hashes:
-                path = self.get_path(hash_hex)
-                if path and path.exists():
-                    path.unlink()
-                del self._manifest[hash_hex]
-                removed.append(hash_hex)
-
-        expected_paths = set()
-        for hash_hex, entry in self._manifest.items():
-            suffix = f".{entry['type']}" if entry.get("type") else ""
-            expected_paths.add((self.root / f"{hash_hex}{suffix}").resolve())
+        removed = [h for h in self._manifest if h not in referenced_hashes]
+        for hash_hex in removed:
+            entry = self._manifest.pop(hash_hex)
+            self._entry_path(hash_hex, entry).unlink(missing_ok=True)
+
+        expected_paths = {
+            self._entry_path(hash_hex, entry).resolve()
+            for hash_hex, entry in self._manifest.items()
+        }
 
-        for path in self.root.rglob("*"):
-            if not path.is_file() or path == self._manifest_path:
+        for entry in iter_files(self.root):
+            path = Path(entry.path)
+            if path == self._manifest_path:
                 continue
             if path.resolve() not in expected_paths:
                 path.unlink()
@@ -134,6 +166,17 @@ class ResourceStore:
         return {}
 
 
+def _hash_file(file_path: Path) -> tuple[str, int]:
+    """Return the sha256 hex digest and size of a file, read in chunks."""
+    digest = hashlib.sha256()
+    size = 0
+    with file_path.open("rb") as f:
+        while chunk := f.read(_HASH_CHUNK_SIZE):
+            digest.update(chunk)
+            size += len(chunk)
+    return digest.hexdigest(), size
+
+
 def _is_sha256_hex(value: str) -> bool:
     return len(value) == 64 and all(c in "0123456789abcdef" for c in value)
 
@@ -149,41 +192,71 @@ RESOURCE_SUFFIXES = frozenset(
         ".svg",
     }
 )
-RESOURCE_SETTING_KEYS = {"bed_model", "bed_texture", "thumbnail", "hotend_model"}
+RESOURCE_SETTING_KEYS = frozenset(
+    {"bed_model", "bed_texture", "thumbnail", "hotend_model"}
+)
 
 
-def collect_resources(extracted_dir: Path, store: ResourceStore) -> dict[str, str]:
+def collect_resources(
+    extracted_dir: Path, store: ResourceStore, link: bool = False
+) -> dict[str, str]:
     """Walk extracted dir and content-address supported resource files.
 
     Both the basename and the extraction-relative path are indexed.  Current
     slicer metadata generally uses basenames, while accepting relative paths
     keeps the resource layer independent from a particular slicer's layout.
+    ``link`` is passed through to ResourceStore.store.
     """
     resource_map: dict[str, str] = {}
-    for file_path in sorted(extracted_dir.rglob("*")):
-        if not file_path.is_file() or file_path.suffix.lower() not in RESOURCE_SUFFIXES:
-            continue
-        hash_hex = store.store(file_path, relative_to=extracted_dir)
+    resource_paths = sorted(
+        Path(entry.path)
+        for entry in iter_files(extracted_dir)
+        if os.path.splitext(entry.name)[1].lower() in RESOURCE_SUFFIXES
+    )
+    # Hashing releases the GIL, so files are hashed on a thread pool while the
+    # manifest is only touched from this thread, in sorted order.
+    if len(resource_paths) > 1:
+        with ThreadPoolExecutor() as executor:
+            hashed = list(executor.map(_hash_file, resource_paths))
+    else:
+        hashed = [_hash_file(file_path) for file_path in resource_paths]
+    for file_path, (hash_hex, size) in zip(resource_paths, hashed):
+        store._add(file_path, hash_hex, size, extracted_dir, link)
         resource_map[file_path.name] = hash_hex
         resource_map[file_path.relative_to(extracted_dir).as_posix()] = hash_hex
     store.save_manifest()
     return resource_map
 
 
-def _rewrite_resource_value(value, resource_map: dict[str, str]):
-    """Rewrite resource references recursively without interpreting schemas."""
+def _rewrite_resource_value(value, refs: dict[str, str]):
+    """Rewrite resource references recursively without interpreting schemas.
+
+    ``refs`` maps resource names to their ready-made ``sha256:{hash}`` refs.
+    Containers are only copied when something inside them was rewritten, so
+    values without resource references come back as the same object.
+    """
     if isinstance(value, str):
-        hash_hex = resource_map.get(value)
-        return f"sha256:{hash_hex}" if hash_hex else value
+        return refs.get(value, value)
     if isinstance(value, dict):
-        return {
-            key: _rewrite_resource_value(item, resource_map)
-            for key, item in value.items()
-        }
-    if isinstance(value, list):
-        return [_rewrite_resource_value(item, resource_map) for item in value]
-    if isinstance(value, tuple):
-        return tuple(_rewrite_resource_value(item, resource_map) for item in value)
+        rewritten = None
+        for key, item in value.items():
+            new_item = _rewrite_resource_value(item, refs)
+            if new_item is not item:
+                if rewritten is None:
+                    rewritten = dict(value)
+                rewritten[key] = new_item
+        return value if rewritten is None else rewritten
+    if isinstance(value, (list, tuple)):
+        items = None
+        for i, item in enumerate(value):
+            new_item = _rewrite_resource_value(item, refs)
+            if new_item is not item:
+                if items is None:
+                    items = list(value)
+                items[i] = new_item
+        if items is None:
+            return value
+        return items if isinstance(value, list) else tuple(items)
     return value
 
 
@@ -193,9 +266,29 @@ def rewrite_resource_refs(profiles: list, resource_map: dict[str, str]) -> None:
     Mutates profiles in place.  Context is included because typed assets and
     other non-engine metadata intentionally live outside runtime settings.
     """
+    if not resource_map:
+        return
+    for _profile in iter_rewritten_resource_refs(profiles, resource_map):
+        pass
+
+
+def iter_rewritten_resource_refs(
+    profiles: Iterable, resource_map: dict[str, str]
+) -> Iterator:
+    """Like rewrite_resource_refs, but one profile at a time as consumed."""
+    if not resource_map:
+        yield from profiles
+        return
+    # Build each sha256: ref once rather than once per matching value
+    refs = {
+        name: f"sha256:{hash_hex}"
+        for name, hash_hex in resource_map.items()
+        if hash_hex
+    }
     for profile in profiles:
-        profile.settings = _rewrite_resource_value(profile.settings, resource_map)
-        profile.context = _rewrite_resource_value(profile.context, resource_map)
+        profile.settings = _rewrite_resource_value(profile.settings, refs)
+        profile.context = _rewrite_resource_value(profile.context, refs)
+        yield profile
 
 
 def _collect_hash_refs(value, hashes: set[str]) -> None:
@@ -217,15 +310,18 @@ def collect_referenced_hashes(store_root: Path, slicer_value: str) -> set[str]:
     """Scan stored profiles for a slicer and return referenced resource hashes."""
     hashes = set()
     slicer_dir = store_root / slicer_value
-    for json_file in slicer_dir.rglob("*.json"):
-        if any(
-            part.startswith("_") for part in json_file.relative_to(slicer_dir).parts
-        ):
+    json_files = [
+        Path(entry.path) for entry in iter_files(slicer_dir, ".json", skip_private=True)
+    ]
+    for json_file, raw in read_files_batched(json_files):
+        # Stored profiles are UTF-8 without escaped ASCII, so a file
+        # without the literal prefix has no refs and is not parsed.
+        if b"sha256:" not in raw:
             continue
         try:
-            data = json.loads(json_file.read_text(encoding="utf-8"))
-            _collect_hash_refs(data, hashes)
-        except (OSError, UnicodeError, ValueError) as exc:
+            data = json.loads(raw)
+        except ValueError as exc:
             logger.debug("Skipping unreadable profile %s: %s", json_file, exc)
             continue
+        _collect_hash_refs(data, hashes)
     return hashes
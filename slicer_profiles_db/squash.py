@@ -18,17 +18,20 @@ Key design decisions:
   profiles are rewritten, preventing stale files.
 """
 
-import fileinput
 import json
 import logging
 import re
 import shutil
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import iniconfig
 from iniconfig import IniConfig, ParseError
 
+from .fileio import iter_files
 from .models import ProfileType
+from .versions import INI_VERSION_RE
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +46,9 @@ _INI_SECTION_PREFIXES: dict[str, ProfileType] = {
     "print:": ProfileType.PRINT,
 }
 
+_CONFIG_VERSION_RE = re.compile(r"\s*config_version\s*=\s*(.+)")
+_VERSION_NUM_RE = re.compile(r"([\d]+(?:\.[\d]+)+)")
+
 # Settings ID keys per profile type (added to squashed output)
 _SETTINGS_ID_KEY: dict[ProfileType, str] = {
     ProfileType.FILAMENT: "filament_settings_id",
@@ -73,13 +79,48 @@ def split_prusaslicer_bundle(
     Returns:
         List of paths to created JSON files.
     """
-    if ini_path.suffix != ".ini":
-        return []
-
-    config = _load_ini_config(ini_path)
+    config = _load_ini_bundle(ini_path)
     if config is None:
         return []
 
+    output_dir.mkdir(parents=True, exist_ok=True)
+    created_files: list[Path] = []
+
+    for file_name, data_out in _iter_ini_profiles(config, section_types):
+        out_path = output_dir / file_name
+        with out_path.open("w") as f:
+            json.dump(data_out, f, separators=(",", ":"))
+        created_files.append(out_path)
+
+    return created_files
+
+
+def iter_prusaslicer_bundle(
+    ini_path: Path,
+    section_types: list[str] | None = None,
+) -> Iterator[tuple[str, dict[str, str]]]:
+    """
+    Yield the squashed profiles of a PrusaSlicer INI bundle without writing them.
+
+    Yields ``(file_name, settings)`` pairs in the order split_prusaslicer_bundle
+    writes them; a later pair with the same file name replaces an earlier one
+    on disk.  See split_prusaslicer_bundle for the arguments.
+    """
+    config = _load_ini_bundle(ini_path)
+    if config is not None:
+        yield from _iter_ini_profiles(config, section_types)
+
+
+def _load_ini_bundle(ini_path: Path) -> IniConfig | None:
+    if ini_path.suffix != ".ini":
+        return None
+    return _load_ini_config(ini_path)
+
+
+def _iter_ini_profiles(
+    config: IniConfig,
+    section_types: list[str] | None,
+) -> Iterator[tuple[str, dict[str, str]]]:
     # Determine which section prefixes to process
     if section_types:
         prefixes = {
@@ -99,9 +140,6 @@ def split_prusaslicer_bundle(
                 )
                 break
 
-    output_dir.mkdir(parents=True, exist_ok=True)
-    created_files: list[Path] = []
-
     for profile_type, profiles in profiles_by_type.items():
         squashed: dict[str, dict[str, str]] = {}
         settings_id_key = _SETTINGS_ID_KEY.get(profile_type)
@@ -112,18 +150,13 @@ def split_prusaslicer_bundle(
                 continue
 
             safe_name = name.replace("/", " ")
-            out_path = output_dir / f"{safe_name}.json"
             data_out = _squash_ini_inheritance(name, profiles, squashed)
 
             # Add the settings ID to the output
             if settings_id_key and settings_id_key != "name":
                 data_out[settings_id_key] = name
 
-            with out_path.open("w") as f:
-                json.dump(data_out, f, indent=4)
-            created_files.append(out_path)
-
-    return created_files
+            yield f"{safe_name}.json", data_out
 
 
 def _squash_ini_inheritance(
@@ -139,13 +172,22 @@ def _squash_ini_inheritance(
 
     profile = profiles[profile_name]
     if "inherits" not in profile:
+        squashed[profile_name] = profile
         return profile
 
-    profile_out: dict[str, str] = {}
-    for parent in profile["inherits"].split(";"):
-        parent = parent.strip()
-        if parent:
-            profile_out.update(_squash_ini_inheritance(parent, profiles, squashed))
+    inherits = profile["inherits"]
+    if ";" not in inherits:
+        # Single parent, by far the most common chain shape
+        parent = inherits.strip()
+        profile_out = (
+            _squash_ini_inheritance(parent, profiles, squashed).copy() if parent else {}
+        )
+    else:
+        profile_out = {}
+        for parent in inherits.split(";"):
+            parent = parent.strip()
+            if parent:
+                profile_out.update(_squash_ini_inheritance(parent, profiles, squashed))
     profile_out.update(profile)
     del profile_out["inherits"]
     squashed[profile_name] = profile_out
@@ -217,24 +259,6 @@ def squash_slic3r_profiles(
     # Squash inheritance
     squashed: dict[str, dict] = {}
 
-    def squash_inherits(profile_name: str) -> dict:
-        if profile_name in squashed:
-            return squashed[profile_name]
-
-        entry = profiles.get(profile_name)
-        if entry is None:
-            return {}
-
-        profile = entry[1]
-        if "inherits" not in profile:
-            return profile
-
-        profile_out = squash_inherits(profile["inherits"]).copy()
-        profile_out.update(profile)
-        del profile_out["inherits"]
-        squashed[profile_name] = profile_out
-        return squashed[profile_name]
-
     # Remove existing vendor directory contents and rewrite only instantiable profiles
     # (matches original behavior: shutil.rmtree then selective rewrite)
     shutil.rmtree(vendor_dir)
@@ -262,23 +286,58 @@ def squash_slic3r_profiles(
                 continue
 
         path.parent.mkdir(parents=True, exist_ok=True)
-        try:
-            squashed_data = squash_inherits(name)
-            with path.open("w") as f:
-                json.dump(squashed_data, f, indent=4)
-            created_files.append(path)
-        except (KeyError, RecursionError) as e:
+        squashed_data = _squash_json_inheritance(name, profiles, squashed)
+        if squashed_data is None:
             logger.warning(
-                "Failed to squash profile: vendor=%s, profile=%s: %s",
+                "Failed to squash profile: vendor=%s, profile=%s: inheritance cycle",
                 vendor_dir.name,
                 name,
-                e,
             )
             continue
+        with path.open("w") as f:
+            json.dump(squashed_data, f, separators=(",", ":"))
+        created_files.append(path)
 
     return created_files
 
 
+def _squash_json_inheritance(
+    profile_name: str,
+    profiles: dict[str, tuple[Path, dict]],
+    squashed: dict[str, dict],
+) -> dict | None:
+    """Resolve one JSON profile's inherits chain; None if the chain is cyclic."""
+    # Follow the chain up to the first resolved (or unresolvable) ancestor,
+    # then squash back down it, memoizing every link on the way.
+    chain: list[str] = []
+    seen: set[str] = set()
+    name = profile_name
+    while name not in squashed:
+        entry = profiles.get(name)
+        if entry is None:
+            base: dict = {}
+            break
+        profile = entry[1]
+        if "inherits" not in profile:
+            squashed[name] = profile
+            base = profile
+            break
+        if name in seen:
+            return None
+        seen.add(name)
+        chain.append(name)
+        name = profile["inherits"]
+    else:
+        base = squashed[name]
+
+    for name in reversed(chain):
+        profile_out = base.copy()
+        profile_out.update(profiles[name][1])
+        del profile_out["inherits"]
+        squashed[name] = base = profile_out
+    return base
+
+
 def select_latest_ini_bundle(vendor_dir: Path) -> Path | None:
     """
     Find the highest-version INI file in a vendor directory.
@@ -287,25 +346,34 @@ def select_latest_ini_bundle(vendor_dir: Path) -> Path | None:
     dot-separated numeric parts).  Returns the path to the latest version,
     or None if no INI files found.
     """
-    from .models import _version_key
-
-    version_re = re.compile(r"([\d]+(?:\.[\d]+)+)\.ini$", re.IGNORECASE)
-    latest_key: tuple[int, ...] = ()
-    latest_path: Path | None = None
-
     if not vendor_dir.exists():
         return None
+    latest = _latest_versioned_ini(list(vendor_dir.iterdir()))
+    return latest[1] if latest else None
 
-    for config_file in vendor_dir.iterdir():
-        match = version_re.search(config_file.name)
-        if not match:
-            continue
-        ver = _version_key(match.group(1))
+
+def _versioned_inis(entries: list[Path]) -> list[tuple[str, Path]]:
+    """Return ``(version, path)`` for the versioned INI bundles among entries."""
+    versioned = []
+    for config_file in entries:
+        match = INI_VERSION_RE.search(config_file.name)
+        if match:
+            versioned.append((match.group(1), config_file))
+    return versioned
+
+
+def _latest_versioned_ini(entries: list[Path]) -> tuple[str, Path] | None:
+    """Return ``(version, path)`` of the highest versioned INI among entries."""
+    from .models import _version_key
+
+    latest_key: tuple[int, ...] = ()
+    latest: tuple[str, Path] | None = None
+    for version, config_file in _versioned_inis(entries):
+        ver = _version_key(version)
         if ver > latest_key:
             latest_key = ver
-            latest_path = config_file
-
-    return latest_path
+            latest = (version, config_file)
+    return latest
 
 
 def unpack_prusaslicer_bundles(
@@ -342,25 +410,26 @@ def unpack_prusaslicer_bundles(
     all_created: list[Path] = []
     detected_version: str | None = None
     detected_version_key: tuple[int, ...] = ()
-    version_re = re.compile(r"([\d]+(?:\.[\d]+)+)\.ini$", re.IGNORECASE)
 
     for vendor_dir in prusaslicer_dir.iterdir():
         if not vendor_dir.is_dir():
             continue
 
+        # One listing serves bundle selection and the cleanup below
+        entries = list(vendor_dir.iterdir())
+
         # Try versioned filenames first (e.g. 2.9.3.ini)
-        latest_ini = select_latest_ini_bundle(vendor_dir)
-        if latest_ini is not None:
+        latest = _latest_versioned_ini(entries)
+        if latest is not None:
             # Track the highest version across all vendors
-            m = version_re.search(latest_ini.name)
-            if m:
-                vk = _version_key(m.group(1))
-                if vk > detected_version_key:
-                    detected_version_key = vk
-                    detected_version = m.group(1)
+            version, latest_ini = latest
+            vk = _version_key(version)
+            if vk > detected_version_key:
+                detected_version_key = vk
+                detected_version = version
         else:
             # Fall back to vendor-named INI (e.g. Creality.ini)
-            vendor_inis = list(vendor_dir.glob("*.ini"))
+            vendor_inis = [p for p in entries if p.name.endswith(".ini")]
             if vendor_inis:
                 latest_ini = vendor_inis[0]
                 # Extract config_version from the INI content
@@ -374,7 +443,7 @@ def unpack_prusaslicer_bundles(
                 continue
 
         # Remove non-latest INI files
-        for config_file in vendor_dir.iterdir():
+        for config_file in entries:
             if config_file.suffix == ".ini" and config_file != latest_ini:
                 config_file.unlink()
 
@@ -421,7 +490,6 @@ def iter_ini_bundle_versions(
         min_version: If set, skip versions below this threshold.
     """
     from .models import _version_key
-    from .versions import enumerate_ini_versions
 
     _relocate_flat_inis(directory)
 
@@ -433,17 +501,16 @@ def iter_ini_bundle_versions(
             continue
 
         # Try versioned filenames first (e.g. 2.9.3.ini)
-        ini_versions = enumerate_ini_versions(vendor_dir)
-        if ini_versions:
-            version_re = re.compile(r"([\d]+(?:\.[\d]+)+)\.ini$", re.IGNORECASE)
-            for ini_file in vendor_dir.iterdir():
-                m = version_re.search(ini_file.name)
-                if m:
-                    triples.append((m.group(1), vendor_dir.name, ini_file))
+        entries = list(vendor_dir.iterdir())
+        versioned = _versioned_inis(entries)
+        if versioned:
+            for version, ini_file in versioned:
+                triples.append((version, vendor_dir.name, ini_file))
         else:
             # Flat layout: vendor-named INI (e.g. Creality/Creality.ini)
-            vendor_inis = list(vendor_dir.glob("*.ini"))
-            for ini_file in vendor_inis:
+            for ini_file in entries:
+                if not ini_file.name.endswith(".ini"):
+                    continue
                 cv = _read_config_version(ini_file)
                 if cv:
                     triples.append((cv, vendor_dir.name, ini_file))
@@ -466,15 +533,14 @@ def iter_ini_bundle_versions(
 
 def _read_config_version(ini_path: Path) -> str | None:
     """Read config_version from a PrusaSlicer/Slic3r INI file's [vendor] section."""
-    cv_re = re.compile(r"^\s*config_version\s*=\s*(.+)", re.MULTILINE)
-    ver_re = re.compile(r"([\d]+(?:\.[\d]+)+)")
     try:
-        text = ini_path.read_text(encoding="utf-8", errors="replace")
-        m = cv_re.search(text)
-        if m:
-            vm = ver_re.search(m.group(1))
-            if vm:
-                return vm.group(1)
+        # config_version sits near the top, so stop at the first matching line
+        with ini_path.open(encoding="utf-8", errors="replace") as f:
+            for line in f:
+                m = _CONFIG_VERSION_RE.match(line)
+                if m:
+                    vm = _VERSION_NUM_RE.search(m.group(1))
+                    return vm.group(1) if vm else None
     except OSError:
         pass
     return None
@@ -539,10 +605,14 @@ def _load_ini_config(path: Path) -> IniConfig | None:
         return IniConfig(path)
     except ParseError as e:
         if e.msg == "unexpected value continuation":
-            with fileinput.FileInput(path, inplace=True) as f:
-                for line in f:
-                    print(line.strip())
-            return IniConfig(path)
+            # Strip every line, repair the file on disk in one write and parse
+            # the repaired text without reading it back.
+            lines = path.read_text(encoding="utf-8").split("\n")
+            if lines[-1] == "":
+                lines.pop()
+            data = "".join(f"{line.strip()}\n" for line in lines)
+            path.write_text(data, encoding="utf-8")
+            return IniConfig(path, data=data)
         return None
 
 
@@ -570,17 +640,22 @@ def _load_json_from_folder(
     if not folder.exists():
         return profiles
 
-    for item in folder.iterdir():
-        if item.is_dir():
-            profiles.update(_load_json_from_folder(item, profile_type_filter))
-            continue
-        if item.suffix != ".json":
-            continue
+    # Reading overlaps on a thread pool; results come back in walk order, so
+    # later files still override earlier ones with the same name.
+    paths = [
+        Path(entry.path)
+        for entry in iter_files(folder, ".json", follow_symlinks=True)
+        # Path.suffix also rules out a file named just ".json"
+        if Path(entry.name).suffix == ".json"
+    ]
+    if len(paths) > 1:
+        with ThreadPoolExecutor() as executor:
+            loaded = list(executor.map(_read_json_file, paths))
+    else:
+        loaded = [_read_json_file(item) for item in paths]
 
-        try:
-            with item.open() as f:
-                file_data = json.load(f)
-        except (json.JSONDecodeError, OSError):
+    for item, file_data in zip(paths, loaded):
+        if file_data is None:
             continue
 
         # Apply type filter only when the file has an explicit "type" field.
@@ -608,3 +683,11 @@ def _load_json_from_folder(
         profiles[name] = (item, file_data)
 
     return profiles
+
+
+def _read_json_file(path: Path) -> dict | None:
+    """Load one JSON file, or return None if it cannot be read or parsed."""
+    try:
+        return json.loads(path.read_bytes())
+    except (json.JSONDecodeError, OSError):
+        return None
@@ -5,9 +5,13 @@ ProfileStore: persistent versioned storage with change detection.
 import hashlib
 import json
 import logging
+import os
 import re
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
 from pathlib import Path
 
+from .fileio import iter_files, read_files_batched, write_atomic
 from .models import (
     IngestionReport,
     ParsedProfile,
@@ -18,6 +22,13 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+# Stored profiles read ahead of validation by list_profiles
+
+# Filename sanitization: characters that are problematic on filesystems, and
+# the runs of underscores left behind after replacing them
+_UNSAFE_FILENAME_CHARS_RE = re.compile(r'[<>:"/\\|?*]')
+_UNDERSCORE_RUN_RE = re.compile(r"_+")
+
 
 class ProfileStore:
     """
@@ -57,30 +68,21 @@ class ProfileStore:
 
     def _get_parser(self, slicer: SlicerType):
         """Lazy-import parsers to avoid circular dependency."""
-        from .parsers import (
-            AnycubicSlicerParser,
-            BambuStudioParser,
-            CrealityPrintParser,
-            CuraParser,
-            ElegooSlicerParser,
-            KiriMotoParser,
-            OrcaSlicerParser,
-            PrusaSlicerParser,
-            SuperSlicerParser,
-        )
-
-        parsers = {
-            SlicerType.BAMBUSTUDIO: BambuStudioParser,
-            SlicerType.ORCASLICER: OrcaSlicerParser,
-            SlicerType.CREALITYPRINT: CrealityPrintParser,
-            SlicerType.PRUSASLICER: PrusaSlicerParser,
-            SlicerType.CURA: CuraParser,
-            SlicerType.ELEGOOSLICER: ElegooSlicerParser,
-            SlicerType.ANYCUBICSLICER: AnycubicSlicerParser,
-            SlicerType.SUPERSLICER: SuperSlicerParser,
-            SlicerType.KIRIMOTO: KiriMotoParser,
+        from . import parsers
+
+        parser_names = {
+            SlicerType.BAMBUSTUDIO: "BambuStudioParser",
+            SlicerType.ORCASLICER: "OrcaSlicerParser",
+            SlicerType.CREALITYPRINT: "CrealityPrintParser",
+            SlicerType.PRUSASLICER: "PrusaSlicerParser",
+            SlicerType.CURA: "CuraParser",
+            SlicerType.ELEGOOSLICER: "ElegooSlicerParser",
+            SlicerType.ANYCUBICSLICER: "AnycubicSlicerParser",
+            SlicerType.SUPERSLICER: "SuperSlicerParser",
+            SlicerType.KIRIMOTO: "KiriMotoParser",
         }
-        return parsers[slicer]()
+        # Only the requested slicer's parser module gets imported
+        return getattr(parsers, parser_names[slicer])()
 
     def ingest(
         self,
@@ -113,11 +115,14 @@ class ProfileStore:
         self,
         slicer: SlicerType,
         version: str,
-        profiles: list[ParsedProfile],
+        profiles: Iterable[ParsedProfile],
     ) -> IngestionReport:
         """
         Ingest pre-parsed profiles into the store for a given version.
 
+        ``profiles`` is consumed once, so a parser's generator can be passed
+        straight in.
+
         - New profiles: creates StoredProfile with first_seen = version
         - Existing profiles: compares each setting value; adds new version
           entry only if the value changed
@@ -132,16 +137,13 @@ class ProfileStore:
         for p in profiles:
             key = self._profile_key(slicer, p.profile_type, p.vendor, p.name)
             deduped[key] = p
-        profiles = list(deduped.values())
 
         added = []
         changed = {}
-        seen_keys = set()
-
-        for p in profiles:
-            key = self._profile_key(slicer, p.profile_type, p.vendor, p.name)
-            seen_keys.add(key)
+        # Type directories already created during this ingest
+        made_dirs: set[Path] = set()
 
+        for p in deduped.values():
             existing = self._load(slicer, p.profile_type.value, p.vendor, p.name)
             if existing is None:
                 stored = self._create_stored(p, version)
@@ -154,17 +156,17 @@ class ProfileStore:
                     if old_profile is not None:
                         self._merge_rename(stored, old_profile)
                         self._delete(slicer, p.profile_type.value, p.vendor, old_name)
-                self._save(stored)
+                self._save(stored, made_dirs)
                 added.append(p.name)
             else:
                 changed_keys = self._merge_version(existing, p, version)
                 if changed_keys:
                     changed[p.name] = changed_keys
-                    self._save(existing)
+                    self._save(existing, made_dirs)
 
         # Detect removed profiles
         all_keys = self._list_profile_keys(slicer)
-        removed = [k for k in all_keys if k not in seen_keys]
+        removed = [k for k in all_keys if k not in deduped]
 
         # Only advance slicer metadata when this ingest changed stored state.
         # This avoids synthetic branch-based versions (for example daily Cura
@@ -176,11 +178,11 @@ class ProfileStore:
         return IngestionReport(
             slicer=slicer,
             version=version,
-            profiles_processed=len(profiles),
+            profiles_processed=len(deduped),
             added=added,
             removed=removed,
             changed=changed,
-            unchanged=len(profiles) - len(added) - len(changed),
+            unchanged=len(deduped) - len(added) - len(changed),
         )
 
     def get(
@@ -199,49 +201,41 @@ class ProfileStore:
         profile_type: str | None = None,
     ) -> list[StoredProfile]:
         """List all stored profiles for a slicer, optionally filtered by type."""
-        slicer_dir = self.root / slicer.value
-        if not slicer_dir.exists():
-            return []
+        return list(self.iter_profiles(slicer, profile_type))
 
-        profiles = []
+    def iter_profiles(
+        self,
+        slicer: SlicerType,
+        profile_type: str | None = None,
+    ) -> Iterator[StoredProfile]:
+        """Yield stored profiles for a slicer, optionally filtered by type.
 
-        for vendor_dir in slicer_dir.iterdir():
-            if not vendor_dir.is_dir() or vendor_dir.name.startswith("_"):
+        Files are read and validated as the caller consumes them, so a caller
+        that stops early never parses the rest of the store.
+        """
+        json_files: list[str] = []
+        for vendor_entry in _list_subdirs(self.root / slicer.value):
+            if vendor_entry.name.startswith("_"):
                 continue
 
             if profile_type:
-                type_dir = vendor_dir / profile_type
-                if type_dir.exists():
-                    for json_file in type_dir.rglob("*.json"):
-                        try:
-                            profiles.append(
-                                StoredProfile.model_validate_json(
-                                    json_file.read_text(encoding="utf-8")
-                                )
-                            )
-                        except (OSError, UnicodeError, ValueError) as exc:
-                            logger.debug(
-                                "Skipping unreadable profile %s: %s", json_file, exc
-                            )
-                            continue
+                # A vendor without this type simply yields no files.
+                type_dir = os.path.join(vendor_entry.path, profile_type)
+                json_files.extend(e.path for e in iter_files(type_dir, ".json"))
             else:
-                for type_dir in vendor_dir.iterdir():
-                    if not type_dir.is_dir():
-                        continue
-                    for json_file in type_dir.rglob("*.json"):
-                        try:
-                            profiles.append(
-                                StoredProfile.model_validate_json(
-                                    json_file.read_text(encoding="utf-8")
-                                )
-                            )
-                        except (OSError, UnicodeError, ValueError) as exc:
-                            logger.debug(
-                                "Skipping unreadable profile %s: %s", json_file, exc
-                            )
-                            continue
-
-        return profiles
+                for type_entry in _list_subdirs(vendor_entry.path):
+                    json_files.extend(
+                        e.path for e in iter_files(type_entry.path, ".json")
+                    )
+
+        # Validation stays on this thread and in file order.
+        for json_file, raw in read_files_batched(json_files):
+            try:
+                profile = StoredProfile.model_validate_json(raw)
+            except ValueError as exc:
+                logger.debug("Skipping unreadable profile %s: %s", json_file, exc)
+                continue
+            yield profile
 
     def get_versions(self, slicer: SlicerType) -> list[str]:
         """Get all ingested versions for a slicer, in order."""
@@ -256,7 +250,7 @@ class ProfileStore:
         removed.
         """
         removed = 0
-        for profile in self.list_profiles(slicer):
+        for profile in self.iter_profiles(slicer):
             changed = False
             for key, versions in profile.settings.items():
                 entries = list(versions.items())
@@ -264,8 +258,8 @@ class ProfileStore:
                     continue
                 cleaned = {entries[0][0]: entries[0][1]}
                 for ver, val in entries[1:]:
-                    prev_val = list(cleaned.values())[-1]
-                    if self._normalize(prev_val) != self._normalize(val):
+                    prev_val = next(reversed(cleaned.values()))
+                    if not self._same_value(prev_val, val):
                         cleaned[ver] = val
                 if len(cleaned) < len(entries):
                     profile.settings[key] = cleaned
@@ -294,8 +288,8 @@ class ProfileStore:
                 continue
             parsed_keys.add(key)
             current = stored.get_latest(key)
-            if self._normalize(current) != self._normalize(new_value):
-                stored.settings.setdefault(key, {})[version] = new_value
+            if not self._same_value(current, new_value):
+                stored.set_setting(key, version, new_value)
                 changed.append(key)
 
         # Record setting removals as a null tombstone.  Without this, a setting
@@ -306,7 +300,7 @@ class ProfileStore:
                 continue
             current = stored.get_latest(key)
             if current is not None:
-                stored.settings.setdefault(key, {})[version] = None
+                stored.set_setting(key, version, None)
                 changed.append(key)
 
         metadata_changed = False
@@ -395,17 +389,17 @@ class ProfileStore:
         path = self._profile_path(slicer, profile_type, vendor, name)
         if not path.exists():
             return None
-        return StoredProfile.model_validate_json(path.read_text(encoding="utf-8"))
+        return StoredProfile.model_validate_json(path.read_bytes())
 
-    def _save(self, stored: StoredProfile) -> None:
+    def _save(self, stored: StoredProfile, made_dirs: set[Path] | None = None) -> None:
         path = self._profile_path(
             stored.slicer, stored.profile_type, stored.vendor, stored.name
         )
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(
-            stored.model_dump_json(indent=2),
-            encoding="utf-8",
-        )
+        if made_dirs is None or path.parent not in made_dirs:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if made_dirs is not None:
+                made_dirs.add(path.parent)
+        write_atomic(path, stored.model_dump_json(indent=2))
 
     def _list_profile_keys(self, slicer: SlicerType) -> set[str]:
         """List all existing profile keys for a slicer from disk.
@@ -416,33 +410,24 @@ class ProfileStore:
         profiles as removed immediately after writing them.
         """
         keys = set()
-        slicer_dir = self.root / slicer.value
-        if not slicer_dir.exists():
-            return keys
-
-        for vendor_dir in slicer_dir.iterdir():
-            if not vendor_dir.is_dir() or vendor_dir.name.startswith("_"):
+        for vendor_entry in _list_subdirs(self.root / slicer.value):
+            if vendor_entry.name.startswith("_"):
                 continue
-            vendor = vendor_dir.name
-            for type_dir in vendor_dir.iterdir():
-                if not type_dir.is_dir():
-                    continue
-                profile_type = type_dir.name
-                for json_file in type_dir.rglob("*.json"):
+            vendor = vendor_entry.name
+            for type_entry in _list_subdirs(vendor_entry.path):
+                profile_type = type_entry.name
+                for entry in iter_files(type_entry.path, ".json"):
                     try:
                         stored = StoredProfile.model_validate_json(
-                            json_file.read_text(encoding="utf-8")
+                            Path(entry.path).read_bytes()
                         )
                     except (OSError, ValueError):
                         logger.warning(
                             "Using filename identity for invalid stored profile: %s",
-                            json_file,
-                        )
-                        keys.add(
-                            self._profile_key(
-                                slicer, profile_type, vendor, json_file.stem
-                            )
+                            entry.path,
                         )
+                        stem = os.path.splitext(entry.name)[0]
+                        keys.add(self._profile_key(slicer, profile_type, vendor, stem))
                         continue
                     keys.add(
                         self._profile_key(
@@ -471,10 +456,7 @@ class ProfileStore:
 
         meta_path = self.root / slicer.value / "_meta.json"
         meta_path.parent.mkdir(parents=True, exist_ok=True)
-        meta_path.write_text(
-            json.dumps(meta, indent=2, ensure_ascii=False),
-            encoding="utf-8",
-        )
+        write_atomic(meta_path, json.dumps(meta, indent=2, ensure_ascii=False))
 
     @staticmethod
     def _extract_renamed_from(settings: dict) -> str | None:
@@ -492,9 +474,7 @@ class ProfileStore:
             return rf
         # Handle dict form (e.g. {"version": "old name"}) in case any source uses it
         if isinstance(rf, dict):
-            for old_name in rf.values():
-                if isinstance(old_name, str):
-                    return old_name
+            return next((v for v in rf.values() if isinstance(v, str)), None)
         return None
 
     def _merge_rename(
@@ -530,12 +510,14 @@ class ProfileStore:
             path.unlink()
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _sanitize(name: str) -> str:
-        """Sanitize a profile name for use as a filename."""
-        # Replace characters that are problematic on filesystems
-        sanitized = re.sub(r'[<>:"/\\|?*]', "_", name)
-        # Collapse multiple underscores
-        sanitized = re.sub(r"_+", "_", sanitized)
+        """Sanitize a profile name for use as a filename.
+
+        Cached: each profile's path is computed several times per ingest.
+        """
+        sanitized = _UNSAFE_FILENAME_CHARS_RE.sub("_", name)
+        sanitized = _UNDERSCORE_RUN_RE.sub("_", sanitized)
         sanitized = sanitized.strip("_. ")
         if not sanitized:
             return "profile"
@@ -557,9 +539,35 @@ class ProfileStore:
         prefix = prefix.strip("_. ") or "profile"
         return f"{prefix}{separator}{suffix}"
 
+    @staticmethod
+    def _same_value(a, b) -> bool:
+        """Whether two setting values normalize identically.
+
+        Most slicer settings are plain strings or lists of strings (the
+        per-extruder values of the JSON slicers).  Those normalize identically
+        exactly when they are equal, so they skip the ``json.dumps`` round trip.
+        """
+        if type(a) is str and type(b) is str:
+            return a == b
+        if type(a) is list and type(b) is list:
+            if len(a) != len(b):
+                return False
+            if all(type(x) is str for x in a) and all(type(x) is str for x in b):
+                return a == b
+        return ProfileStore._normalize(a) == ProfileStore._normalize(b)
+
     @staticmethod
     def _normalize(value) -> str:
         """Normalize a value for comparison."""
         if value is None:
             return ""
         return json.dumps(value, sort_keys=True, ensure_ascii=False)
+
+
+def _list_subdirs(directory: str | Path) -> list[os.DirEntry]:
+    """Return the subdirectory entries of ``directory``, or [] if it is missing."""
+    try:
+        with os.scandir(directory) as it:
+            return [entry for entry in it if entry.is_dir()]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
@@ -65,6 +65,9 @@ def sort_versions(versions: list[str]) -> list[str]:
 
 
 _PRERELEASE_RE = re.compile(r"(?:alpha|beta|rc|dev|pre)", re.IGNORECASE)
+# Versioned INI bundle filenames, e.g. 2.9.3.ini or 2.5.59.0.ini
+INI_VERSION_RE = re.compile(r"([\d]+(?:\.[\d]+)+)\.ini$", re.IGNORECASE)
+_TAGS_PER_PAGE = 100
 
 
 def is_prerelease(version: str) -> bool:
@@ -99,31 +102,36 @@ def enumerate_github_tags(
     page = 1
     pattern = re.compile(tag_pattern) if tag_pattern else None
 
-    while True:
-        resp = requests.get(
-            f"https://api.github.com/repos/{repo}/tags",
-            headers=headers,
-            params={"per_page": 100, "page": page},
-            timeout=30,
-        )
-        resp.raise_for_status()
-        data = resp.json()
-        if not data:
-            break
-
-        for tag_data in data:
-            name = tag_data["name"]
-            if pattern and not pattern.search(name):
-                continue
-            tags.append(
-                VersionInfo(
-                    raw=name,
-                    normalized=normalize_version(name),
-                    slicer=slicer or SlicerType.BAMBUSTUDIO,
-                )
+    # One session for all pages so the TLS connection is reused.
+    with requests.Session() as session:
+        session.headers.update(headers)
+        while True:
+            resp = session.get(
+                f"https://api.github.com/repos/{repo}/tags",
+                params={"per_page": _TAGS_PER_PAGE, "page": page},
+                timeout=30,
             )
+            resp.raise_for_status()
+            data = resp.json()
+            if not data:
+                break
+
+            for tag_data in data:
+                name = tag_data["name"]
+                if pattern and not pattern.search(name):
+                    continue
+                tags.append(
+                    VersionInfo(
+                        raw=name,
+                        normalized=normalize_version(name),
+                        slicer=slicer or SlicerType.BAMBUSTUDIO,
+                    )
+                )
 
-        page += 1
+            # A short page is the last one; skip the extra empty request.
+            if len(data) < _TAGS_PER_PAGE:
+                break
+            page += 1
 
     return tags
 
@@ -134,12 +142,14 @@ def enumerate_ini_versions(vendor_dir: Path) -> list[str]:
 
     Example: vendor_dir contains "2.9.3.ini" → ["2.9.3"]
     """
-    version_re = re.compile(r"([\d]+(?:\.[\d]+)+)\.ini$", re.IGNORECASE)
+    try:
+        with os.scandir(vendor_dir) as it:
+            names = [entry.name for entry in it]
+    except FileNotFoundError:
+        return []
     versions = []
-    if not vendor_dir.exists():
-        return versions
-    for f in vendor_dir.iterdir():
-        match = version_re.search(f.name)
+    for name in names:
+        match = INI_VERSION_RE.search(name)
         if match:
             versions.append(match.group(1))
     return sort_versions(versions)
@@ -0,0 +1,43 @@
+from slicer_profiles_db.brands import BRAND_MAPS
+from slicer_profiles_db.matching import PrinterModelIndex, match_printer_model
+from slicer_profiles_db.models import SlicerType
+
+
+def test_index_matches_vendor_names_and_aliases():
+    models = [
+        {"id": 1, "brand": "prusa", "name": "mk4"},
+        {"id": 2, "brand": "prusa", "name": "mk3s"},
+        {"id": 3, "brand": "creality", "name": "ender-3 v3 ke"},
+        {"id": 4, "brand": "creality", "name": "k1 max"},
+    ]
+    brands = ["prusa", "creality"]
+    aliases = {2: ["original prusa i3 mk3s+"], 4: ["K1 Max (0.4)"]}
+    brand_map = BRAND_MAPS[SlicerType.PRUSASLICER]
+    index = PrinterModelIndex(models, brands, aliases)
+
+    expected = [
+        ("PrusaResearch", "Original Prusa MK4", {1}),
+        ("PrusaResearch", "Original Prusa i3 MK3S+", {2}),
+        ("PrusaResearch", "MK3S && MK4 MMU3", {1, 2}),
+        ("Creality", "Creality Ender 3 V3 KE", {3}),
+        ("Creality", "Creality K1 Max (0.4)", {4}),
+        ("Unknown", "MK4", set()),
+    ]
+    for vendor, name, ids in expected:
+        assert index.match(vendor, name, brand_map) == ids, (vendor, name)
+
+
+def test_brand_rules_that_rewrite_simplyprint_names_still_match():
+    models = [
+        {"id": 1, "brand": "voron", "name": "voron 0.x"},
+        {"id": 2, "brand": "rat rig", "name": "v-core 4.1 (500)"},
+    ]
+    brands = ["voron", "rat rig"]
+    brand_map = BRAND_MAPS[SlicerType.ORCASLICER]
+
+    assert match_printer_model(
+        models, brands, {}, "Voron", "Voron Zero 120mm", brand_map
+    ) == {1}
+    assert match_printer_model(
+        models, brands, {}, "RatRig", "V-Core-4.0 500mm", brand_map
+    ) == {2}
@@ -0,0 +1,55 @@
+import json
+
+from slicer_profiles_db import ProfileIndex, SlicerType, StoredProfile
+from slicer_profiles_db.ofd.mapper import SlicerMapper
+from slicer_profiles_db.store import ProfileStore
+
+
+def _build_index(tmp_path):
+    profile = StoredProfile(
+        slicer="bambustudio",
+        profile_type="filament",
+        name="Bambu PLA Matte @BBL X1C",
+        vendor="BBL",
+        first_seen="1.0",
+        last_seen="1.0",
+        filament_id="GFA01",
+        settings={"filament_type": {"1.0": ["PLA"]}},
+    )
+    profile_dir = tmp_path / "store" / "bambustudio" / "BBL" / "filament"
+    profile_dir.mkdir(parents=True)
+    (profile_dir / "matte.json").write_text(profile.model_dump_json())
+
+    index = ProfileIndex(ProfileStore(tmp_path / "store"))
+    index.build([SlicerType.BAMBUSTUDIO])
+    return index
+
+
+def test_writes_mappings_and_leaves_unchanged_files_alone(tmp_path):
+    data_dir = tmp_path / "data"
+    filament_dir = data_dir / "bambu_lab" / "PLA" / "matte"
+    filament_dir.mkdir(parents=True)
+    (data_dir / "bambu_lab" / "brand.json").write_text('{"name": "Bambu Lab"}')
+    filament_path = filament_dir / "filament.json"
+    filament_path.write_text(
+        json.dumps({"name": "Matte", "slicer_ids": {"orcaslicer": "GFL99"}})
+    )
+    mapper = SlicerMapper(_build_index(tmp_path), data_dir)
+
+    report = mapper.run(slicers=["bambustudio"])
+
+    assert [r.profile_name for r in report.updated] == ["Bambu PLA Matte"]
+    assert json.loads(filament_path.read_text()) == {
+        "name": "Matte",
+        "slicer_settings": {
+            "orcaslicer": {"id": "GFL99"},
+            "bambustudio": {"profile_name": "Bambu PLA Matte", "id": "GFA01"},
+        },
+    }
+
+    mtime = filament_path.stat().st_mtime_ns
+    report = mapper.run(slicers=["bambustudio"])
+
+    assert not report.updated
+    assert len(report.already_correct) == 1
+    assert filament_path.stat().st_mtime_ns == mtime
@@ -0,0 +1,100 @@
+import json
+
+from slicer_profiles_db.download import apply_overlays
+from slicer_profiles_db.models import ProfileType, SlicerType
+from slicer_profiles_db.parsers.prusaslicer import PrusaSlicerParser
+from slicer_profiles_db.pipeline import ProfilePipeline
+from slicer_profiles_db.squash import split_prusaslicer_bundle
+from slicer_profiles_db.store import ProfileStore
+
+BUNDLE = """\
+[vendor]
+name = Prusa Research
+config_version = 2.1.0
+
+[printer_model:MK4]
+name = Original Prusa MK4
+variants = 0.4; 0.6
+
+[print:*common*]
+layer_height = 0.2
+perimeters = 2
+
+[print:*fast*]
+perimeters = 3
+infill_speed = 200
+
+[print:0.20mm QUALITY]
+inherits = *common*
+print_settings_id = 0.20mm QUALITY
+
+[print:0.20mm SPEED]
+inherits = *common*; *fast*
+layer_height = 0.25
+
+[filament:*PLA*]
+filament_type = PLA
+temperature = 215
+
+[filament:Generic PLA]
+inherits = *PLA*
+filament_vendor = Generic
+
+[filament:Generic PLA Silk]
+inherits = Generic PLA
+temperature = 225
+
+[filament:Generic PLA/Silk]
+inherits = Generic PLA Silk
+temperature = 230
+
+[printer:Original Prusa MK4]
+printer_model = MK4
+nozzle_diameter = 0.4
+"""
+
+
+def test_in_memory_ini_parse_matches_split_files(tmp_path):
+    bundle = tmp_path / "PrusaResearch.ini"
+    bundle.write_text(BUNDLE)
+    overlay_vendor = tmp_path / "overlays" / "prusaslicer" / "PrusaResearch"
+    overlay_vendor.mkdir(parents=True)
+    (overlay_vendor / "Extra PETG.json").write_text(
+        json.dumps({"filament_settings_id": "Extra PETG", "filament_type": "PETG"})
+    )
+    (overlay_vendor / "broken.json").write_text("{")
+    (overlay_vendor / "bed.stl").write_bytes(b"solid")
+
+    # The flow the in-memory parse replaced: split, overlay, parse the files
+    split_dir = tmp_path / "split"
+    split_prusaslicer_bundle(bundle, split_dir / "PrusaResearch")
+    apply_overlays(split_dir, tmp_path / "overlays", SlicerType.PRUSASLICER)
+    parser = PrusaSlicerParser()
+    pipeline = ProfilePipeline(
+        ProfileStore(tmp_path / "store"), overlay_dir=tmp_path / "overlays"
+    )
+    vendor_inis = [("PrusaResearch", bundle)]
+
+    for profile_types in ([ProfileType.FILAMENT], None):
+        on_disk = list(
+            parser.parse_directory(split_dir, profile_type_filter=profile_types)
+        )
+        in_memory = pipeline._parse_ini_version(
+            parser, SlicerType.PRUSASLICER, split_dir, vendor_inis, profile_types
+        )
+        assert in_memory == on_disk
+
+    by_name = {p.name: p for p in on_disk}
+    assert set(by_name) == {
+        "Original Prusa MK4",
+        "0.20mm QUALITY",
+        "0.20mm SPEED",
+        "Generic PLA",
+        "Generic PLA/Silk",
+        "Extra PETG",
+    }
+    assert by_name["0.20mm SPEED"].settings["perimeters"] == "3"
+    # "Generic PLA/Silk" overwrites the file "Generic PLA Silk" was split into
+    silk = by_name["Generic PLA/Silk"].settings
+    assert silk["temperature"] == "230"
+    assert silk["filament_vendor"] == "Generic"
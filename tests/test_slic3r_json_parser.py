@@ -0,0 +1,35 @@
+import json
+
+from slicer_profiles_db.models import ProfileType
+from slicer_profiles_db.parsers import base
+from slicer_profiles_db.parsers.orcaslicer import OrcaSlicerParser
+
+
+def _write_vendor(root):
+    filament_dir = root / "Generic" / "filament"
+    filament_dir.mkdir(parents=True)
+    for i in range(4):
+        (filament_dir / f"pla{i}.json").write_text(
+            json.dumps({"type": "filament", "name": f"PLA {i}"})
+        )
+    (filament_dir / "broken.json").write_text("{")
+    process_dir = root / "Generic" / "process"
+    process_dir.mkdir()
+    (process_dir / "fine.json").write_text(json.dumps({"type": "process"}))
+
+
+def test_parallel_parse_matches_serial(tmp_path, monkeypatch):
+    _write_vendor(tmp_path)
+    parser = OrcaSlicerParser()
+    serial = list(parser.parse_directory(tmp_path))
+
+    monkeypatch.setattr(base, "_PARALLEL_MIN_FILES", 1)
+    monkeypatch.setattr(base.os, "cpu_count", lambda: 2)
+    parallel = list(parser.parse_directory(tmp_path))
+    filtered = list(
+        parser.parse_directory(tmp_path, profile_type_filter=[ProfileType.PRINT])
+    )
+
+    assert [p.name for p in serial] == ["PLA 0", "PLA 1", "PLA 2", "PLA 3", "fine"]
+    assert parallel == serial
+    assert [(p.name, p.vendor) for p in filtered] == [("fine", "Generic")]
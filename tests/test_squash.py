@@ -0,0 +1,86 @@
+import json
+
+from slicer_profiles_db.squash import squash_slic3r_profiles
+
+
+def _write_profiles(vendor_dir, profiles):
+    vendor_dir.mkdir(parents=True)
+    for name, data in profiles.items():
+        (vendor_dir / f"{name}.json").write_text(json.dumps({"name": name, **data}))
+
+
+def test_squash_slic3r_profiles_inherits_edge_cases(tmp_path, caplog):
+    vendor_dir = tmp_path / "Acme"
+    _write_profiles(
+        vendor_dir,
+        {
+            "fdm_filament_common": {"nozzle_temperature": ["210"], "cooling": "1"},
+            "Acme PLA @base": {
+                "inherits": "fdm_filament_common",
+                "filament_type": ["PLA"],
+            },
+            "Acme PLA": {
+                "type": "filament",
+                "instantiation": "true",
+                "inherits": "Acme PLA @base",
+            },
+            "Acme PLA Matte": {
+                "type": "filament",
+                "instantiation": "true",
+                "inherits": "Acme PLA @base",
+                "nozzle_temperature": ["220"],
+            },
+            "Acme Orphan": {
+                "type": "filament",
+                "instantiation": "true",
+                "inherits": "does not exist",
+                "filament_type": ["PETG"],
+            },
+            "Acme Self": {
+                "type": "filament",
+                "instantiation": "true",
+                "inherits": "Acme Self",
+            },
+            "Acme Loop A": {
+                "type": "filament",
+                "instantiation": "true",
+                "inherits": "Acme Loop B",
+            },
+            "Acme Loop B": {"inherits": "Acme Loop A"},
+        },
+    )
+
+    created = squash_slic3r_profiles(vendor_dir)
+
+    assert sorted(p.name for p in created) == [
+        "Acme Orphan.json",
+        "Acme PLA Matte.json",
+        "Acme PLA.json",
+    ]
+    assert sorted(p.name for p in vendor_dir.iterdir()) == sorted(
+        p.name for p in created
+    )
+
+    def load(name):
+        return json.loads((vendor_dir / f"{name}.json").read_text())
+
+    # Both children share the memoized "@base" squash without mutating it
+    assert load("Acme PLA") == {
+        "name": "Acme PLA",
+        "nozzle_temperature": ["210"],
+        "cooling": "1",
+        "filament_type": ["PLA"],
+        "type": "filament",
+        "instantiation": "true",
+    }
+    assert load("Acme PLA Matte")["nozzle_temperature"] == ["220"]
+    assert load("Acme PLA Matte")["filament_type"] == ["PLA"]
+    # A missing parent squashes onto nothing rather than dropping the profile
+    assert load("Acme Orphan") == {
+        "name": "Acme Orphan",
+        "type": "filament",
+        "instantiation": "true",
+        "filament_type": ["PETG"],
+    }
+    assert "profile=Acme Self: inheritance cycle" in caplog.text
+    assert "profile=Acme Loop A: inheritance cycle" in caplog.text
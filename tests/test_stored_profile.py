@@ -0,0 +1,63 @@
+from slicer_profiles_db.models import StoredProfile
+
+
+def _profile(settings):
+    return StoredProfile(
+        slicer="orcaslicer",
+        profile_type="filament",
+        name="Generic PLA",
+        vendor="OrcaFilamentLibrary",
+        first_seen="2.0.0",
+        last_seen="2.2.0",
+        settings=settings,
+    )
+
+
+def test_lookups_use_semantic_version_order():
+    profile = _profile(
+        {
+            "temperature": {"2.0.0": 210, "2.10.0": 220, "2.2.0": 215},
+            "removed": {"2.0.0": 1, "2.2.0": None},
+            "added_later": {"2.2.0": "x"},
+        }
+    )
+
+    assert profile.get_at_version("temperature", "1.9") is None
+    assert profile.get_at_version("temperature", "2.1.0") == 210
+    assert profile.get_at_version("temperature", "2.9.0") == 215
+    assert profile.get_at_version("temperature", "2-10-0") == 220
+    assert profile.evaluate("2.0.0") == {"temperature": 210, "removed": 1}
+    assert profile.evaluate("2.2.0") == {"temperature": 215, "added_later": "x"}
+    assert profile.changed_settings("2.0.0", "2.2.0") == {
+        "temperature": (210, 215),
+        "removed": (1, None),
+        "added_later": (None, "x"),
+    }
+
+
+def test_lookups_see_versions_added_after_a_previous_lookup():
+    profile = _profile({"temperature": {"2.0.0": 210}})
+    assert profile.evaluate("3.0.0") == {"temperature": 210}
+
+    profile.settings["temperature"]["3.0.0"] = 230
+    assert profile.evaluate("3.0.0") == {"temperature": 230}
+
+    profile.settings["temperature"] = {"2.0.0": 200}
+    assert profile.get_at_version("temperature", "3.0.0") == 200
+
+
+def test_lookups_see_entries_overwritten_in_place():
+    # Re-ingesting a mutable version (main, nightly) overwrites its entry.
+    profile = _profile({"temperature": {"1.0": 200, "2.0": 210}})
+    assert profile.evaluate("2.0") == {"temperature": 210}
+
+    profile.set_setting("temperature", "2.0", 230)
+    assert profile.evaluate("2.0") == {"temperature": 230}
+    assert profile.get_at_version("temperature", "2.0") == 230
+
+    # An equal value of another type is still a new entry.
+    profile.set_setting("temperature", "2.0", 230.0)
+    assert type(profile.get_at_version("temperature", "2.0")) is float
+
+    profile.set_setting("temperature", "2.0", None)
+    assert profile.evaluate("2.0") == {}